@@ -1,14 +1,15 @@
 # api_key_encryptor.py
 
 import base64
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import getpass
 
-# 암호화 함수
-def encrypt_data(data: str, password: str) -> bytes:
-    """주어진 비밀번호를 기반으로 데이터를 암호화합니다."""
+# cryptography는 실제 암호화 시점에만 import (모듈 import 비용 최소화)
+
+# 비밀번호로부터 암호화 키 생성 (480,000회 반복이라 느리므로 호출마다 한 번만 유도)
+# 비밀번호/키가 프로세스 메모리에 남지 않도록 캐시하지 않음 (여러 값은 encrypt_bulk로 한 번에 암호화)
+def _derive(password: bytes) -> bytes:
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
     salt = b'salt_for_api_keys_' # 고정된 솔트 (실제로는 랜덤 생성 후 저장해야 더 안전)
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
@@ -16,12 +17,23 @@ def encrypt_data(data: str, password: str) -> bytes:
         salt=salt,
         iterations=480000,
     )
-    # 비밀번호로부터 암호화 키 생성
-    key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-    f = Fernet(key)
+    return base64.urlsafe_b64encode(kdf.derive(password))
+
+# 암호화 함수
+def encrypt_data(data: str, password: str) -> bytes:
+    """주어진 비밀번호를 기반으로 데이터를 암호화합니다."""
+    from cryptography.fernet import Fernet
+    f = Fernet(_derive(password.encode()))
     # 데이터를 암호화
     return f.encrypt(data.encode())
 
+# 여러 값을 한 번에 암호화 (키 유도와 Fernet 객체 생성을 한 번만 수행)
+def encrypt_bulk(datas: list, password: str) -> list:
+    """같은 비밀번호로 여러 데이터를 암호화합니다."""
+    from cryptography.fernet import Fernet
+    f = Fernet(_derive(password.encode()))
+    return [f.encrypt(data.encode()) for data in datas]
+
 if __name__ == '__main__':
     print("--- API 키 암호화 유틸리티 ---")
     
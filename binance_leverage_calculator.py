@@ -10,19 +10,40 @@ from PyQt5.QtWidgets import (
     QRadioButton, QSlider, QGridLayout
 )
 from PyQt5.QtGui import QFont, QDoubleValidator, QCursor
-from PyQt5.QtCore import Qt, QObject, pyqtSignal, QThread, QTimer
+from PyQt5.QtCore import Qt, QObject, QEvent, pyqtSignal, QThread, QTimer
 
-from binance.client import Client
+from binance.client import Client, AsyncClient
 from binance.exceptions import BinanceAPIException
+from requests.adapters import HTTPAdapter
 import config
 
+# uvloop은 Windows를 지원하지 않으므로 없으면 기본 asyncio 루프를 사용합니다.
+try: import uvloop
+except ImportError: uvloop = None
+# orjson이 있으면 호가 메시지 디코딩에 사용합니다.
+try: from orjson import loads as json_loads
+except ImportError: json_loads = json.loads
+# msgspec이 있으면 depth5 스키마(s, a, b)만 골라 디코딩합니다. (나머지 필드는 파싱 생략)
+try: import msgspec
+except ImportError: msgspec = None
+if msgspec:
+    class Depth(msgspec.Struct):
+        s: str = ''; a: list = []; b: list = []
+    depth_decoder = msgspec.json.Decoder(Depth)
+# numba가 없으면 목표가 계산 함수를 일반 파이썬 함수로 그대로 사용합니다.
+try: from numba import njit
+except ImportError:
+    def njit(*args, **kwargs): return lambda func: func
+
 # --- 커스텀 라벨 클래스 ---
 class ClickablePriceLabel(QLabel):
-    clicked = pyqtSignal(str)
+    _font = None; _cursor = None  # 모든 호가 라벨이 공유 (QApplication 생성 후 최초 1회만 생성)
     def __init__(self, text, color, parent=None):
         super().__init__(text, parent)
+        if ClickablePriceLabel._font is None:
+            ClickablePriceLabel._font = QFont("Arial", 11, QFont.Bold); ClickablePriceLabel._cursor = QCursor(Qt.PointingHandCursor)
         self.color = color; self.setAlignment(Qt.AlignCenter)
-        self.setFont(QFont("Arial", 11, QFont.Bold)); self.setCursor(QCursor(Qt.PointingHandCursor))
+        self.setFont(self._font); self.setCursor(self._cursor)
         self.setStyleSheet(f"""
             QLabel {{
                 background-color: #FFFFFF; color: {self.color}; border: 1px solid #DCDCDC;
@@ -30,39 +51,90 @@ class ClickablePriceLabel(QLabel):
             }}
             QLabel:hover {{ background-color: #F0F0F0; }}
         """)
-    def mousePressEvent(self, event): self.clicked.emit(self.text())
 
 # --- WebSocket 워커 ---
 class BinanceWorker(QObject):
-    data_received = pyqtSignal(dict); connection_error = pyqtSignal(str)
+    connection_error = pyqtSignal(str)
     def __init__(self, symbol):
         super().__init__(); self.symbol = symbol.lower(); self.running = False
-        self.websocket_uri = f"wss://fstream.binance.com/ws/{self.symbol}@depth5@100ms"
+        # 최신 호가 스냅샷 (UI 타이머가 주기적으로 가져감, 중간 프레임은 버려도 무방)
+        self.latest_data = None
+        # 심볼 변경 시 재연결하지 않고 같은 연결에서 SUBSCRIBE/UNSUBSCRIBE만 보냅니다.
+        self.websocket_uri = "wss://fstream.binance.com/ws"; self.websocket = None; self.request_id = 0
+        self.loop = None; self.async_client = None; self.submitted = set()
     def run(self):
-        self.running = True; asyncio.run(self.connect_and_listen())
+        self.running = True
+        self.loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop(); asyncio.set_event_loop(self.loop)
+        try: self.loop.run_until_complete(self.connect_and_listen())
+        finally:
+            # 연결이 끊겨도 전송 중인 그리드 주문은 끝까지 기다려 결과(future)가 항상 완료되도록 합니다.
+            pending = asyncio.all_tasks(self.loop)
+            if pending: self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            if self.async_client: self.loop.run_until_complete(self.async_client.close_connection())
+            self.loop.close()
+            # 드레인 이후에 예약돼 실행되지 못한 작업은 취소로 완료시켜 결과 콜백이 반드시 호출되게 합니다.
+            for future in list(self.submitted): future.cancel()
+    def submit(self, coro):
+        # 다른 스레드에서 이 워커 루프로 코루틴을 보냅니다. (루프 종료 시 미완료 future를 정리하기 위해 추적)
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        self.submitted.add(future); future.add_done_callback(self.submitted.discard)
+        return future
+    async def create_orders(self, orders):
+        # 그리드 주문을 동시에 전송합니다. (AsyncClient는 이 워커의 이벤트 루프에서만 사용)
+        if self.async_client is None: self.async_client = await AsyncClient.create(config.API_KEY, config.SECRET_KEY)
+        return await asyncio.gather(*(self.async_client.futures_create_order(**o) for o in orders), return_exceptions=True)
+    async def send_request(self, method, symbol):
+        self.request_id += 1
+        await self.websocket.send(json.dumps({"method": method, "params": [f"{symbol}@depth5@100ms"], "id": self.request_id}))
+    async def switch_symbol(self, symbol):
+        old_symbol = self.symbol; self.symbol = symbol.lower(); self.latest_data = None
+        if self.websocket is None: return
+        await self.send_request("UNSUBSCRIBE", old_symbol); await self.send_request("SUBSCRIBE", self.symbol)
     async def connect_and_listen(self):
         try:
-            async with websockets.connect(self.websocket_uri) as websocket:
+            # depth5 메시지는 작아서 permessage-deflate 압축이 오히려 손해이므로 끕니다.
+            # 연결 유지 확인은 메시지마다 wait_for를 거는 대신 라이브러리의 ping/pong에 맡깁니다.
+            async with websockets.connect(self.websocket_uri, compression=None, max_size=2**20, ping_interval=20, ping_timeout=10) as websocket:
+                self.websocket = websocket; await self.send_request("SUBSCRIBE", self.symbol)
                 while self.running:
-                    try:
-                        message = await asyncio.wait_for(websocket.recv(), timeout=10.0)
-                        self.data_received.emit(json.loads(message))
-                    except (asyncio.TimeoutError, websockets.exceptions.ConnectionClosed):
-                        print(f"{self.symbol} WebSocket 연결 문제 발생, 재연결 시도..."); break
+                    message = await websocket.recv()
+                    if msgspec: depth = depth_decoder.decode(message); symbol, asks, bids = depth.s, depth.a, depth.b
+                    else: data = json_loads(message); symbol, asks, bids = data.get('s', ''), data.get('a', []), data.get('b', [])
+                    # 구독 응답({"result":..., "id":...})과 전환 직후 도착한 이전 심볼 프레임은 버립니다.
+                    if symbol.lower() == self.symbol: self.latest_data = {'a': asks, 'b': bids}
+        except websockets.exceptions.ConnectionClosed: print(f"{self.symbol} WebSocket 연결 문제 발생, 재연결 시도...")
         except Exception as e: self.connection_error.emit(f"WebSocket 연결 실패: {e}")
+        finally: self.websocket = None
     def stop(self): self.running = False
 
 # --- 핵심 계산 로직 ---
+POSITION_LONG = 0; POSITION_SHORT = 1
+# 수수료율 (미리보기는 float, 주문 가격 확정은 Decimal 값을 사용)
+TAKER_FEE_RATE = Decimal('0.0004'); MAKER_FEE_RATE = Decimal('0.0002')
+
+# 키 입력마다 호출되므로 float64로 JIT 컴파일합니다. (결과는 호출 측에서 Tick Size로 다시 조정)
+@njit('f8(f8,f8,f8,i8,f8)', cache=True, fastmath=True)
 def calculate_target_price(
-    entry_price: Decimal, leverage: Decimal, target_roi_percent: Decimal, position_type: str, fee_rate: Decimal
+    entry_price: float, leverage: float, target_roi_percent: float, position_side: int, fee_rate: float
+) -> float:
+    target_roi = target_roi_percent / 100.0
+    if position_side == POSITION_LONG: return entry_price * (1.0 + (target_roi / leverage) + fee_rate) / (1.0 - fee_rate)
+    elif position_side == POSITION_SHORT: return entry_price * (1.0 - (target_roi / leverage) - fee_rate) / (1.0 + fee_rate)
+    raise ValueError("Position side must be POSITION_LONG or POSITION_SHORT")
+
+# 주문 가격용 Decimal 버전 (float 결과는 Tick 경계 근처에서 한 틱 아래로 내려갈 수 있으므로 주문에는 사용하지 않음)
+def calculate_target_price_decimal(
+    entry_price: Decimal, leverage: Decimal, target_roi_percent: Decimal, position_side: int, fee_rate: Decimal
 ) -> Decimal:
-    target_roi = target_roi_percent / Decimal('100.0')
-    if position_type.lower() == 'long': return entry_price * (Decimal('1') + (target_roi / leverage) + fee_rate) / (Decimal('1') - fee_rate)
-    elif position_type.lower() == 'short': return entry_price * (Decimal('1') - (target_roi / leverage) - fee_rate) / (Decimal('1') + fee_rate)
-    raise ValueError("Position type must be 'long' or 'short'")
+    target_roi = target_roi_percent / Decimal('100')
+    if position_side == POSITION_LONG: return entry_price * (Decimal('1') + (target_roi / leverage) + fee_rate) / (Decimal('1') - fee_rate)
+    elif position_side == POSITION_SHORT: return entry_price * (Decimal('1') - (target_roi / leverage) - fee_rate) / (Decimal('1') + fee_rate)
+    raise ValueError("Position side must be POSITION_LONG or POSITION_SHORT")
 
 # --- GUI 애플리케이션 클래스 ---
 class BinanceCalculatorApp(QWidget):
+    # 워커 루프에서 끝난 그리드 주문 결과를 메인 스레드로 전달 (주문 목록, 결과 목록 또는 예외)
+    grid_orders_done = pyqtSignal(object, object)
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Binance Station Alpha V1.0 (Live Mode)")
@@ -70,16 +142,25 @@ class BinanceCalculatorApp(QWidget):
         
         try:
             self.client = Client(config.API_KEY, config.SECRET_KEY)
+            # 분할 주문 등 연속 REST 호출 시 TLS 연결을 재사용하도록 keep-alive 풀 크기 확장
+            self.client.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
             self.client.API_URL = 'https://fapi.binance.com/fapi'; self.client.futures_ping()
             print("바이낸스 실제 서버 클라이언트 초기화 성공.")
         except Exception as e:
             QMessageBox.critical(self, "API 연결 실패", f"API 키 또는 연결을 확인해주세요.\n오류: {e}"); sys.exit()
 
-        self.current_selected_symbol = "BTCUSDT"; self.position_type = None
+        self.current_selected_symbol = "BTCUSDT"; self.position_type = None; self.position_type_int = None
         self.worker_thread = None; self.worker = None; self.available_balance = Decimal('0')
         self.best_ask_price = Decimal('0'); self.best_bid_price = Decimal('0')
         self.symbol_info = {}; self.tick_size = Decimal('0'); self.step_size = Decimal('0')
-        self.latest_order_book_data = {} 
+        self.latest_order_book_data = {}; self._symbol_info_cache = {}
+        self.ask_prices_raw = [None] * 5; self.bid_prices_raw = [None] * 5  # 호가 라벨별 원본 가격 문자열
+        self._last_ask_text = [None] * 5; self._last_bid_text = [None] * 5  # 변경 없는 라벨은 setText 생략
+
+        # 입력 중 연속 textChanged를 50ms 단위로 묶어 한 번만 계산
+        self.calc_timer = QTimer(self); self.calc_timer.setSingleShot(True); self.calc_timer.setInterval(50)
+        self.calc_timer.timeout.connect(self.calculate_and_display_target)
+        self.grid_orders_done.connect(self.on_grid_orders_done)
 
         self.initUI()
         self.start_worker(); self.update_asset_balance(); self.fetch_symbol_info()
@@ -96,9 +177,10 @@ class BinanceCalculatorApp(QWidget):
     def initUI(self):
         grid = QGridLayout(); self.setLayout(grid)
         label_font = QFont("Arial", 10); input_font = QFont("Arial", 10); result_font = QFont("Arial", 14, QFont.Bold); button_font = QFont("Arial", 10, QFont.Bold)
+        bold_font = QFont("Arial", 11, QFont.Bold); mono_font = QFont("Consolas", 10); amount_validator = QDoubleValidator(0.0, 1e6, 8, self)
         
         self.asset_group_box = QGroupBox("자산 현황 (USDT)"); asset_layout = QVBoxLayout()
-        self.balance_label = QLabel("사용 가능: $0.00", self); self.balance_label.setFont(QFont("Arial", 11, QFont.Bold))
+        self.balance_label = QLabel("사용 가능: $0.00", self); self.balance_label.setFont(bold_font)
         asset_layout.addWidget(self.balance_label); self.asset_group_box.setLayout(asset_layout)
 
         symbol_group_box = QGroupBox("거래 종목 선택"); symbol_layout = QVBoxLayout()
@@ -110,7 +192,7 @@ class BinanceCalculatorApp(QWidget):
         input_group_box = QGroupBox("거래 정보 입력"); input_form_layout = QVBoxLayout()
         entry_price_layout = QHBoxLayout(); entry_price_label = QLabel("기준 가격:")
         self.entry_price_input = QLineEdit(self); self.entry_price_input.setValidator(QDoubleValidator(0.0, 1e9, 8)); self.entry_price_input.setText("0.00")
-        self.entry_price_input.textChanged.connect(self.calculate_and_display_target)
+        self.entry_price_input.textChanged.connect(lambda _: self.calc_timer.start())
         self.entry_price_input.editingFinished.connect(self.format_entry_price)
         entry_price_layout.addWidget(entry_price_label); entry_price_layout.addWidget(self.entry_price_input); input_form_layout.addLayout(entry_price_layout)
         
@@ -118,15 +200,15 @@ class BinanceCalculatorApp(QWidget):
         self.leverage_label = QLabel("레버리지 (x):")
         self.leverage_label.setToolTip("종목 변경 시 최대 레버리지가 자동으로 설정됩니다.")
         self.leverage_input = QLineEdit(self); self.leverage_input.setValidator(QDoubleValidator(1.0, 125.0, 0)); self.leverage_input.setText("10")
-        self.leverage_input.textChanged.connect(self.calculate_and_display_target)
+        self.leverage_input.textChanged.connect(lambda _: self.calc_timer.start())
         leverage_layout.addWidget(self.leverage_label); leverage_layout.addWidget(self.leverage_input); input_form_layout.addLayout(leverage_layout)
         
         roi_layout = QHBoxLayout(); roi_label = QLabel("목표 수익률 (%):")
         self.roi_input = QLineEdit(self); self.roi_input.setValidator(QDoubleValidator(0.01, 1e6, 2)); self.roi_input.setText("10")
-        self.roi_input.textChanged.connect(self.calculate_and_display_target)
+        self.roi_input.textChanged.connect(lambda _: self.calc_timer.start())
         roi_layout.addWidget(roi_label); roi_layout.addWidget(self.roi_input); input_form_layout.addLayout(roi_layout)
         quantity_layout = QHBoxLayout(); quantity_label = QLabel("총 주문 수량:")
-        self.quantity_input = QLineEdit(self); self.quantity_input.setValidator(QDoubleValidator(0.0, 1e6, 8)); self.quantity_input.setText("0.001")
+        self.quantity_input = QLineEdit(self); self.quantity_input.setValidator(amount_validator); self.quantity_input.setText("0.001")
         quantity_layout.addWidget(quantity_label); quantity_layout.addWidget(self.quantity_input)
         # [추가할 코드] ---------------------------------------------
         self.max_button = QPushButton("Max", self)
@@ -143,7 +225,7 @@ class BinanceCalculatorApp(QWidget):
         slider_layout.addWidget(self.quantity_slider); slider_layout.addWidget(self.slider_label)
         input_form_layout.addLayout(slider_layout)
         grid_layout = QHBoxLayout(); grid_count_label = QLabel("분할 개수:"); self.grid_count_input = QLineEdit(self); self.grid_count_input.setText("1"); self.grid_count_input.setValidator(QDoubleValidator(1, 100, 0))
-        grid_interval_label = QLabel("가격 간격(Tick):"); self.grid_interval_input = QLineEdit(self); self.grid_interval_input.setText("10"); self.grid_interval_input.setValidator(QDoubleValidator(0, 1e6, 8))
+        grid_interval_label = QLabel("가격 간격(Tick):"); self.grid_interval_input = QLineEdit(self); self.grid_interval_input.setText("10"); self.grid_interval_input.setValidator(amount_validator)
         grid_layout.addWidget(grid_count_label); grid_layout.addWidget(self.grid_count_input); grid_layout.addWidget(grid_interval_label); grid_layout.addWidget(self.grid_interval_input)
         input_form_layout.addLayout(grid_layout)
         fee_type_layout = QHBoxLayout(); fee_type_label = QLabel("수수료 종류:")
@@ -168,14 +250,14 @@ class BinanceCalculatorApp(QWidget):
 
         open_orders_group_box = QGroupBox("미체결 주문 현황"); open_orders_layout = QVBoxLayout()
         self.open_orders_display = QTextEdit(self); self.open_orders_display.setReadOnly(True)
-        self.open_orders_display.setFont(QFont("Consolas", 10)); self.open_orders_display.setText("미체결 주문 없음")
+        self.open_orders_display.setFont(mono_font); self.open_orders_display.setText("미체결 주문 없음")
         self.open_orders_display.setMinimumHeight(100)
         open_orders_layout.addWidget(self.open_orders_display)
         open_orders_group_box.setLayout(open_orders_layout)
 
         position_group_box = QGroupBox("실시간 포지션 현황"); position_layout = QVBoxLayout()
         self.position_display = QTextEdit(self); self.position_display.setReadOnly(True)
-        self.position_display.setFont(QFont("Consolas", 10)); self.position_display.setText("포지션 정보 없음")
+        self.position_display.setFont(mono_font); self.position_display.setText("포지션 정보 없음")
         position_layout.addWidget(self.position_display)
         self.market_close_button = QPushButton("전체 포지션 시장가 청산", self); self.market_close_button.setFont(button_font)
         self.market_close_button.setStyleSheet("background-color: #212529; color: white; padding: 8px;"); self.market_close_button.clicked.connect(self.emergency_market_close)
@@ -185,7 +267,7 @@ class BinanceCalculatorApp(QWidget):
         self.order_book_group_box = QGroupBox(f"{self.current_selected_symbol} 실시간 호가");
         order_book_layout = QVBoxLayout()
         self.ask_price_labels = [ClickablePriceLabel(f"Sell {i+1}: N/A", "#dc3545") for i in range(5)]
-        for label in self.ask_price_labels: order_book_layout.addWidget(label); label.clicked.connect(self.on_order_book_price_clicked)
+        for i, label in enumerate(self.ask_price_labels): order_book_layout.addWidget(label); label.setProperty('side', 'ask'); label.setProperty('idx', i); label.installEventFilter(self)
         order_execution_widget = QWidget() 
         order_layout = QHBoxLayout(); order_layout.setContentsMargins(0, 5, 0, 5) 
         self.place_entry_order_button = QPushButton("포지션 진입", self); self.place_entry_order_button.setStyleSheet("background-color: #28a745; color: white; padding: 12px; font-weight: bold;"); self.place_entry_order_button.clicked.connect(self.place_entry_order)
@@ -193,7 +275,7 @@ class BinanceCalculatorApp(QWidget):
         order_layout.addWidget(self.place_entry_order_button); order_layout.addWidget(self.place_target_order_button)
         order_execution_widget.setLayout(order_layout); order_book_layout.addWidget(order_execution_widget)
         self.bid_price_labels = [ClickablePriceLabel(f"Buy {i+1}: N/A", "#007BFF") for i in range(5)]
-        for label in self.bid_price_labels: order_book_layout.addWidget(label); label.clicked.connect(self.on_order_book_price_clicked)
+        for i, label in enumerate(self.bid_price_labels): order_book_layout.addWidget(label); label.setProperty('side', 'bid'); label.setProperty('idx', i); label.installEventFilter(self)
         self.order_book_group_box.setLayout(order_book_layout)
         
         grid.addWidget(self.asset_group_box, 0, 0); grid.addWidget(symbol_group_box, 1, 0)
@@ -206,26 +288,27 @@ class BinanceCalculatorApp(QWidget):
 
     def buffer_order_book_data(self, data):
         self.latest_order_book_data = data
-        if data.get('asks'): self.best_ask_price = Decimal(data['asks'][0][0])
-        if data.get('bids'): self.best_bid_price = Decimal(data['bids'][0][0])
+        if data.get('a'): self.best_ask_price = Decimal(data['a'][0][0])
+        if data.get('b'): self.best_bid_price = Decimal(data['b'][0][0])
     
     def update_ui_from_buffer(self):
+        data = self.worker.latest_data if self.worker else None
+        if data is not None and data is not self.latest_order_book_data: self.buffer_order_book_data(data)
         if self.latest_order_book_data: self.update_order_book_ui(self.latest_order_book_data)
 
     def update_order_book_ui(self, data):
-        asks = data.get('a', []); bids = data.get('b', [])
-        for i, label in enumerate(self.ask_price_labels):
-            if i < len(asks): label.setText(f"{Decimal(asks[i][0]):,.4f} ({Decimal(asks[i][1]):.3f})")
-            else: label.setText("N/A")
-        for i, label in enumerate(self.bid_price_labels):
-            if i < len(bids): label.setText(f"{Decimal(bids[i][0]):,.4f} ({Decimal(bids[i][1]):.3f})")
-            else: label.setText("N/A")
+        for levels, labels, raw, last in ((data.get('a', []), self.ask_price_labels, self.ask_prices_raw, self._last_ask_text),
+                                          (data.get('b', []), self.bid_price_labels, self.bid_prices_raw, self._last_bid_text)):
+            n = len(levels)
+            for i, label in enumerate(labels):
+                if i < n: p, q = levels[i][0], levels[i][1]; raw[i] = p; text = f"{float(p):,.4f} ({float(q):.3f})"
+                else: raw[i] = None; text = "N/A"
+                if text != last[i]: last[i] = text; label.setText(text)  # 같은 텍스트면 재도장(repaint) 생략
 
     def start_worker(self):
         if self.worker_thread and self.worker_thread.isRunning(): self.stop_worker()
         self.worker = BinanceWorker(self.current_selected_symbol); self.worker_thread = QThread(); self.worker.moveToThread(self.worker_thread)
         self.worker_thread.started.connect(self.worker.run)
-        self.worker.data_received.connect(self.buffer_order_book_data) 
         self.worker.connection_error.connect(self.handle_connection_error); self.worker_thread.start()
 
     def stop_worker(self):
@@ -294,7 +377,8 @@ class BinanceCalculatorApp(QWidget):
 
     def adjust_price(self, price: Decimal) -> Decimal:
         if self.tick_size == Decimal('0'): return price
-        return price.quantize(self.tick_size, rounding=ROUND_DOWN)
+        # 정수 틱 개수로 내림 후 다시 곱합니다. (0.5, 0.25 같은 10의 거듭제곱이 아닌 틱도 정확히 정렬)
+        return (price // self.tick_size) * self.tick_size
 
     def adjust_quantity(self, quantity: Decimal) -> Decimal:
         if self.step_size == Decimal('0'): return quantity
@@ -302,13 +386,16 @@ class BinanceCalculatorApp(QWidget):
 
     def fetch_symbol_info(self):
         try:
-            info = self.client.futures_exchange_info()
-            for s in info['symbols']:
-                if s['symbol'] == self.current_selected_symbol:
-                    self.symbol_info = s
-                    for f in s['filters']:
-                        if f['filterType'] == 'PRICE_FILTER': self.tick_size = Decimal(f['tickSize'])
-                        if f['filterType'] == 'LOT_SIZE': self.step_size = Decimal(f['stepSize'])
+            # 선물 exchangeInfo는 심볼 필터를 지원하지 않으므로 전체 목록을 한 번만 받아 심볼별로 캐시합니다.
+            if self.current_selected_symbol not in self._symbol_info_cache:
+                info = self.client.futures_exchange_info()
+                self._symbol_info_cache = {s['symbol']: s for s in info['symbols']}
+            s = self._symbol_info_cache.get(self.current_selected_symbol)
+            if s:
+                self.symbol_info = s
+                for f in s['filters']:
+                    if f['filterType'] == 'PRICE_FILTER': self.tick_size = Decimal(f['tickSize'])
+                    if f['filterType'] == 'LOT_SIZE': self.step_size = Decimal(f['stepSize'])
             
             leverage_brackets = self.client.futures_leverage_bracket(symbol=self.current_selected_symbol)
             if leverage_brackets:
@@ -341,34 +428,53 @@ class BinanceCalculatorApp(QWidget):
             if order_type == 'entry':
                 title = "포지션 진입"; center_price = Decimal(self.entry_price_input.text()); side = Client.SIDE_BUY if self.position_type == 'long' else Client.SIDE_SELL
             elif order_type == 'target':
-                title = "Target Price Limit"; price_str = self.target_price_label.text().split(': $')[-1].replace(',', '')
-                if "N/A" in price_str: QMessageBox.warning(self, "주문 오류", "목표 가격을 먼저 계산해주세요."); return
-                center_price = Decimal(price_str); side = Client.SIDE_SELL if self.position_type == 'long' else Client.SIDE_BUY
+                # 표시 라벨(float 미리보기)이 아니라 현재 입력값으로 Decimal 목표가를 다시 계산합니다.
+                title = "Target Price Limit"; center_price = self.finalize_target_price()
+                if center_price is None: QMessageBox.warning(self, "주문 오류", "목표 가격을 먼저 계산해주세요."); return
+                side = Client.SIDE_SELL if self.position_type == 'long' else Client.SIDE_BUY
             else: return
-            orders_to_place = []; quantity_per_order = total_quantity / Decimal(grid_count)
+            quantity_per_order = total_quantity / Decimal(grid_count)
             price_interval = Decimal(self.grid_interval_input.text()) * self.tick_size
             price_precision = self.symbol_info.get('pricePrecision')
             start_offset = -(Decimal(grid_count) - Decimal('1')) / Decimal('2')
-            for i in range(grid_count):
-                price_offset = (start_offset + Decimal(i)) * price_interval; price = center_price + price_offset
-                adjusted_price = self.adjust_price(price); adjusted_quantity = self.adjust_quantity(quantity_per_order)
-                orders_to_place.append({'price': str(adjusted_price), 'quantity': str(adjusted_quantity)})
+            # 분할 주문의 수량은 모두 같으므로 한 번만 조정하고, 가격은 한 번의 컴프리헨션으로 계산합니다.
+            adjusted_quantity_str = str(self.adjust_quantity(quantity_per_order))
+            orders_to_place = [{'price': str(self.adjust_price(center_price + (start_offset + i) * price_interval)), 'quantity': adjusted_quantity_str} for i in range(grid_count)]
             msg = f"## {title} 그리드 주문 확인 ({grid_count}개 분할) ##\n\n"
             for i, order in enumerate(orders_to_place): msg += f"  - 주문 {i+1}: 가격 ${Decimal(order['price']):,.{price_precision}f}, 수량 {order['quantity']}\n"
             msg += f"\n총 수량: {total_quantity}\n\n위 내용으로 주문을 실행하시겠습니까?"
             reply = QMessageBox.question(self, f'{title} 확인', msg, QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
             if reply == QMessageBox.Yes:
-                success_count = 0; failed_orders = []
-                for order in orders_to_place:
-                    try:
-                        self.client.futures_create_order(symbol=symbol, side=side, type=Client.ORDER_TYPE_LIMIT,timeInForce=Client.TIME_IN_FORCE_GTC,quantity=order['quantity'], price=order['price'])
-                        success_count += 1
-                    except Exception as e: failed_orders.append((order, e))
-                QMessageBox.information(self, "주문 결과", f"총 {grid_count}개 중 {success_count}개 주문 성공.")
-                if failed_orders: print("실패한 주문:", failed_orders)
-                self.update_asset_balance(); self.update_position_status(); self.update_open_orders_status()
+                order_params = [dict(symbol=symbol, side=side, type=Client.ORDER_TYPE_LIMIT, timeInForce=Client.TIME_IN_FORCE_GTC, quantity=o['quantity'], price=o['price']) for o in orders_to_place]
+                if self.worker and self.worker.loop and self.worker.loop.is_running():
+                    # 워커 루프에서 끝까지 실행하고, 결과는 시그널로 메인 스레드에 전달합니다. (UI 스레드는 기다리지 않음)
+                    future = self.worker.submit(self.worker.create_orders(order_params))
+                    future.add_done_callback(lambda f: self._emit_grid_result(orders_to_place, f))
+                else:
+                    # 워커 루프가 없으면 기존처럼 순차 전송합니다.
+                    results = []
+                    for params in order_params:
+                        try: results.append(self.client.futures_create_order(**params))
+                        except Exception as e: results.append(e)
+                    self.on_grid_orders_done(orders_to_place, results)
         except Exception as e: QMessageBox.critical(self, "오류", f"주문 처리 중 오류가 발생했습니다: {e}")
 
+    def _emit_grid_result(self, orders_to_place, future):
+        # 워커 스레드에서 호출됨: 위젯은 건드리지 않고 시그널만 보냅니다. (취소/예외도 결과로 전달)
+        try: results = future.result()
+        except BaseException as e: results = e
+        self.grid_orders_done.emit(orders_to_place, results)
+    def on_grid_orders_done(self, orders_to_place, results):
+        if isinstance(results, BaseException):
+            # 일괄 전송 자체가 실패해도 일부 주문은 이미 거래소에 접수됐을 수 있습니다.
+            QMessageBox.warning(self, "주문 결과 확인 필요", f"주문 전송 결과를 확인하지 못했습니다: {results}\n\n일부 주문이 이미 접수되었을 수 있으니 미체결 주문을 확인한 뒤 다시 시도하세요.")
+            self.update_open_orders_status(); return
+        failed_orders = [(o, r) for o, r in zip(orders_to_place, results) if isinstance(r, BaseException)]
+        success_count = len(orders_to_place) - len(failed_orders)
+        QMessageBox.information(self, "주문 결과", f"총 {len(orders_to_place)}개 중 {success_count}개 주문 성공.")
+        if failed_orders: print("실패한 주문:", failed_orders)
+        self.update_asset_balance(); self.update_position_status(); self.update_open_orders_status()
+
     # [수정] 빠져있던 함수 추가
     def emergency_market_close(self):
         try:
@@ -447,14 +553,24 @@ class BinanceCalculatorApp(QWidget):
             
     def on_symbol_changed(self, symbol: str):
         self.current_selected_symbol = symbol; self.order_book_group_box.setTitle(f"{self.current_selected_symbol} 실시간 호가")
-        self.stop_worker(); self.start_worker(); self.fetch_symbol_info()
+        self.latest_order_book_data = {}
+        if self.worker and self.worker.loop and self.worker.loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.worker.switch_symbol(symbol), self.worker.loop)
+        else: self.stop_worker(); self.start_worker()
+        self.fetch_symbol_info()
     def handle_connection_error(self, error_message): QMessageBox.critical(self, "연결 오류", f"실시간 데이터 연결에 실패했습니다.\n{error_message}")
-    def on_order_book_price_clicked(self, label_text: str):
-        try:
-            price_str = label_text.split(' ')[0].replace(',', '')
-            self.entry_price_input.setText(price_str)
-        except (ValueError, IndexError): pass
-    def set_position_type(self, p_type: str): self.position_type = p_type; self.update_button_style(); self.calculate_and_display_target()
+    def eventFilter(self, obj, event):
+        # 호가 라벨 10개의 클릭을 이 필터 하나에서 처리 (라벨마다 핸들러/클로저를 두지 않음)
+        if event.type() == QEvent.MouseButtonPress and isinstance(obj, ClickablePriceLabel):
+            self.on_order_book_price_clicked(obj.property('side'), obj.property('idx')); return True
+        return super().eventFilter(obj, event)
+    def on_order_book_price_clicked(self, side: str, idx: int):
+        # 표시용 텍스트를 다시 파싱하지 않고, 호가 갱신 시 저장해 둔 원본 가격을 그대로 사용
+        price_str = (self.ask_prices_raw if side == 'ask' else self.bid_prices_raw)[idx]
+        if price_str is not None: self.entry_price_input.setText(price_str.rstrip('0').rstrip('.') if '.' in price_str else price_str)
+    def set_position_type(self, p_type: str):
+        self.position_type = p_type; self.position_type_int = POSITION_LONG if p_type == 'long' else POSITION_SHORT
+        self.update_button_style(); self.calculate_and_display_target()
     def update_button_style(self):
         default_style = "background-color: #FFFFFF; color: black; padding: 10px; border: 1px solid #DCDCDC;"
         long_selected_style = "background-color: #dc3545; color: white; padding: 10px; border: 1px solid #dc3545;"
@@ -462,27 +578,41 @@ class BinanceCalculatorApp(QWidget):
         if self.position_type == 'long': self.long_button.setStyleSheet(long_selected_style); self.short_button.setStyleSheet(default_style)
         elif self.position_type == 'short': self.long_button.setStyleSheet(default_style); self.short_button.setStyleSheet(short_selected_style)
         else: self.long_button.setStyleSheet(default_style); self.short_button.setStyleSheet(default_style)
+    def selected_fee_rate(self) -> Decimal:
+        return TAKER_FEE_RATE if self.taker_radio.isChecked() else MAKER_FEE_RATE
     def calculate_and_display_target(self):
         try:
-            entry_price = Decimal(self.entry_price_input.text()); leverage = Decimal(self.leverage_input.text())
-            target_roi_percent = Decimal(self.roi_input.text())
-            if self.taker_radio.isChecked(): fee_rate = Decimal('0.0004')
-            else: fee_rate = Decimal('0.0002')
+            # 키 입력마다 호출되는 미리보기이므로 float로만 계산합니다. (주문 가격은 finalize_target_price에서 Decimal로 확정)
+            entry_price = float(self.entry_price_input.text()); leverage = float(self.leverage_input.text())
+            target_roi_percent = float(self.roi_input.text()); fee_rate = float(self.selected_fee_rate())
             if self.position_type is None:
                 self.target_price_label.setText("Target Price: N/A"); self.price_change_label.setText("NLV: N/A"); return
-            if entry_price <= Decimal('0') or leverage <= Decimal('0'):
+            if entry_price <= 0 or leverage <= 0:
                 self.target_price_label.setText("유효한 값을 입력하세요."); self.price_change_label.setText("NLV: N/A"); return
-            target_price = calculate_target_price(entry_price, leverage, target_roi_percent, self.position_type, fee_rate)
-            adjusted_target_price = self.adjust_price(target_price)
+            target_price = calculate_target_price(entry_price, leverage, target_roi_percent, self.position_type_int, fee_rate)
+            # adjust_price와 같은 내림 정렬을 float로 수행합니다. (부동소수 오차 허용)
+            tick = float(self.tick_size)
+            if tick > 0: target_price = math.floor(target_price / tick + 1e-9) * tick
             price_precision = self.symbol_info.get('pricePrecision', 2)
-            self.target_price_label.setText(f"Target Price: ${adjusted_target_price:,.{price_precision}f}")
-            required_change_percent = (target_roi_percent / leverage) + (fee_rate * Decimal('100'))
+            self.target_price_label.setText(f"Target Price: ${target_price:,.{price_precision}f}")
+            required_change_percent = (target_roi_percent / leverage) + (fee_rate * 100)
             if self.position_type == 'long': color = "red"; sign = "+"
             else: color = "blue"; sign = "-"
             html_text = (f"NLV: <b style='color:{color};'>{sign}{required_change_percent:.2f}%</b>")
             self.price_change_label.setText(html_text)
         except Exception:
             self.target_price_label.setText("Target Price: N/A"); self.price_change_label.setText("NLV: N/A")
+    def finalize_target_price(self):
+        # 주문 전용: 입력값으로 목표가를 Decimal로 계산해 Tick Size에 맞추고, 표시값도 주문 가격과 일치시킵니다.
+        try:
+            entry_price = Decimal(self.entry_price_input.text()); leverage = Decimal(self.leverage_input.text())
+            target_roi_percent = Decimal(self.roi_input.text())
+        except Exception: return None
+        if self.position_type_int is None or entry_price <= Decimal('0') or leverage <= Decimal('0'): return None
+        target_price = self.adjust_price(calculate_target_price_decimal(entry_price, leverage, target_roi_percent, self.position_type_int, self.selected_fee_rate()))
+        price_precision = self.symbol_info.get('pricePrecision', 2)
+        self.target_price_label.setText(f"Target Price: ${target_price:,.{price_precision}f}")
+        return target_price
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
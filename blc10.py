@@ -3,23 +3,46 @@ import asyncio
 import websockets
 import json
 import math
+import time
 import concurrent.futures
-from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP, ROUND_CEILING, ROUND_FLOOR
+import collections
+import functools
+from decimal import Decimal, InvalidOperation, ROUND_DOWN, ROUND_HALF_UP, ROUND_CEILING, ROUND_FLOOR
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QComboBox, QMessageBox, QGroupBox, QTextEdit,
     QRadioButton, QSlider, QGridLayout
 )
 from PyQt5.QtGui import QFont, QDoubleValidator, QCursor
-from PyQt5.QtCore import Qt, QObject, pyqtSignal, QThread, QTimer
+from PyQt5.QtCore import Qt, QObject, pyqtSignal, pyqtSlot, QThread, QTimer
 
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
+from requests.adapters import HTTPAdapter
 import config
 import configparser
 import logging
 from logging.handlers import RotatingFileHandler
 
+# 📢 [추가] numba가 설치되어 있으면 목표가 미리보기 계산을 JIT 컴파일 (미설치 시 일반 파이썬 함수)
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# 📢 [추가] uvloop가 설치되어 있으면 WebSocket 루프에 사용 (Windows 등 미지원 환경은 기본 asyncio 루프)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# 📢 [추가] 호가 메시지 디코딩은 orjson 사용 (미설치 시 표준 json)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 
 # --- 로깅 시스템 설정 (수정) ---
 def setup_logging():
@@ -82,21 +105,45 @@ class ClickablePriceLabel(QLabel):
         self.clicked.emit(self.text())
 
 
+# --- 메인 스레드 호출 브릿지 ---
+class MainThreadInvoker(QObject):
+    """다른 스레드에서 invoke.emit(fn)하면 fn이 메인(GUI) 스레드에서 실행됩니다."""
+    invoke = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.invoke.connect(self._run)
+
+    @pyqtSlot(object)
+    def _run(self, fn):
+        fn()
+
+
 # --- WebSocket 워커 (로그 레벨 세분화) ---
 class BinanceWorker(QObject):
-    data_received = pyqtSignal(dict)
-    connection_error = pyqtSignal(str) # 연결 오류 시 이 시그널을 통해 재연결 요청
+    connection_error = pyqtSignal(str) # 연결 오류 알림 (재연결은 워커가 직접 수행)
 
-    def __init__(self, symbol, websocket_uri):
+    def __init__(self, symbols, websocket_uri):
         super().__init__()
-        self.symbol = symbol.lower()
+        # 📢 [수정] Combined Stream(/stream?streams=...) 하나로 여러 심볼을 구독합니다.
+        self.symbols = [s.lower() for s in symbols]
+        self.symbol = '/'.join(self.symbols) # 로그 표시용
         self.running = False
-        self.websocket_uri = f"{websocket_uri}/{self.symbol}@depth5@100ms"
+        self.stream_base_uri = websocket_uri.rsplit('/', 1)[0] + '/stream' # .../ws -> .../stream
+        self.websocket = None
+        self.request_id = 0
+        # 📢 [수정] 시그널 대신 최신 프레임 1개만 보관 (UI 타이머가 가져감, deque append/popleft는 스레드 안전)
+        self.latest_data = collections.deque(maxlen=1)
         self.loop = None 
         self.listen_task = None 
 
+    @property
+    def websocket_uri(self):
+        # 재연결 시에도 현재 구독 중인 심볼 목록으로 접속합니다.
+        return f"{self.stream_base_uri}?streams=" + '/'.join(f"{s}@depth5@100ms" for s in self.symbols)
+
     def run(self):
-        self.loop = asyncio.new_event_loop()
+        self.loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
         
         self.running = True
@@ -115,20 +162,24 @@ class BinanceWorker(QObject):
 
 
     async def connect_and_listen(self):
+        # 📢 [수정] 재연결은 스레드/루프 재생성 없이 이 루프 안에서 지수 백오프(1~30초)로 수행합니다.
+        backoff = 1
         while self.running:
             try:
-                async with websockets.connect(self.websocket_uri) as websocket:
+                # 📢 [수정] 연결 유지 확인은 라이브러리의 ping/pong(ping_interval)에 맡깁니다.
+                async with websockets.connect(self.websocket_uri, ping_interval=20, ping_timeout=10,
+                                              close_timeout=2, max_queue=32) as websocket:
+                    self.websocket = websocket
+                    backoff = 1
                     logging.info(f"{self.symbol} WebSocket에 연결되었습니다.")
                     while self.running:
                         try:
-                            # 10초 타임아웃을 설정하여 연결 활성 상태를 확인
-                            message = await asyncio.wait_for(websocket.recv(), timeout=10.0)
-                            self.data_received.emit(json.loads(message))
-                        except asyncio.TimeoutError:
-                            # 📢 [로그 수정] 정기적인 Ping은 DEBUG 레벨
-                            logging.debug(f"{self.symbol} WebSocket Timeout. Ping 전송.")
-                            await websocket.ping() 
-                            continue 
+                            message = await websocket.recv()
+                            frame = json_loads(message)
+                            # 구독 제어 응답({"result": ..., "id": ...})은 'stream' 필드가 없으므로 건너뜁니다.
+                            stream = frame.get('stream')
+                            if stream:
+                                self.latest_data.append((stream.split('@', 1)[0].upper(), frame['data']))
                         except websockets.exceptions.ConnectionClosed as e:
                             logging.warning(f"{self.symbol} WebSocket 연결이 닫혔습니다. 코드: {e.code}, 이유: {e.reason}")
                             break 
@@ -144,10 +195,46 @@ class BinanceWorker(QObject):
             except Exception as e:
                 if self.running:
                     error_msg = f"WebSocket 연결 실패: {e}"
-                    self.connection_error.emit(error_msg)
                     logging.error(error_msg, exc_info=True)
-                await asyncio.sleep(5) 
-                break 
+                    # 연속 실패 중에는 첫 실패만 UI에 알립니다.
+                    if backoff == 1:
+                        self.connection_error.emit(error_msg)
+            finally:
+                self.websocket = None
+
+            if self.running:
+                logging.info(f"{self.symbol} WebSocket {backoff}초 후 재연결 시도...")
+                try:
+                    await asyncio.sleep(backoff)
+                except asyncio.CancelledError:
+                    break
+                backoff = min(backoff * 2, 30)
+
+    async def send_control(self, method, symbols):
+        """SUBSCRIBE / UNSUBSCRIBE 제어 프레임을 현재 연결로 전송합니다."""
+        if self.websocket is None or not symbols:
+            return
+        self.request_id += 1
+        await self.websocket.send(json.dumps({
+            "method": method, "params": [f"{s}@depth5@100ms" for s in symbols], "id": self.request_id
+        }))
+
+    async def switch_symbols(self, symbols):
+        """연결을 유지한 채 구독 심볼만 교체합니다. (스레드/루프 재생성 없음)"""
+        new_symbols = [s.lower() for s in symbols]
+        removed = [s for s in self.symbols if s not in new_symbols]
+        added = [s for s in new_symbols if s not in self.symbols]
+        self.symbols = new_symbols
+        self.symbol = '/'.join(self.symbols)
+        self.latest_data.clear() # 이전 심볼의 미처리 프레임 폐기
+        try:
+            # 새 심볼을 먼저 구독해 호가 공백 시간을 줄이고, 이후 이전 심볼 구독을 해제합니다.
+            await self.send_control("SUBSCRIBE", added)
+            await self.send_control("UNSUBSCRIBE", removed)
+            logging.info(f"WebSocket 구독 변경: -{removed} +{added}")
+        except Exception as e:
+            # 연결이 끊긴 상태라면 재연결 시 websocket_uri에 새 심볼 목록이 반영됩니다.
+            logging.warning(f"WebSocket 구독 변경 전송 실패 (재연결 시 반영): {e}")
 
     def stop(self):
         if self.running:
@@ -165,19 +252,62 @@ class BinanceWorker(QObject):
 
 
 # --- 핵심 계산 로직 ---
+_DEC_0 = Decimal('0')
+_DEC_1 = Decimal('1')
+_DEC_2 = Decimal('2')
+_DEC_100 = Decimal('100')
+EXCHANGE_INFO_TTL = 3600 # 거래소 정보 캐시 유지 시간(초)
+
+
+# 📢 [추가] 화면 표시용 float 미리보기 (실제 주문 가격은 Decimal 버전으로 확정)
+# 시그니처를 명시해 import 시점에 float64 전용으로 컴파일(캐시)하므로 첫 호출 지연과 타입 디스패치가 없습니다.
+@njit('f8(f8,f8,f8,b1,f8)', cache=True, fastmath=True)
+def _target_price_f(entry, lev, roi_pct, is_long, fee):
+    r = roi_pct / 100.0 / lev
+    if is_long:
+        return entry * (1.0 + r + fee) / (1.0 - fee)
+    return entry * (1.0 - r - fee) / (1.0 + fee)
+
+
+def align_to_step(value: Decimal, step: Decimal, rounding) -> Decimal:
+    """값을 step의 정수 배로 맞춥니다. (quantize와 달리 0.5, 0.25 같은 step도 정확히 정렬)"""
+    return (value / step).to_integral_value(rounding=rounding) * step
+
+
+def _nonzero_amt(s: str) -> bool:
+    """positionAmt 문자열('0', '0.000', '-1.23' 등)이 0이 아닌지 숫자 변환 없이 확인합니다."""
+    return any(ch != '0' and ch.isdigit() for ch in s)
+
+
+# 📢 [추가] 반복되는 가격 문자열은 파싱된 Decimal을 재사용합니다. (Decimal은 불변이라 공유해도 안전)
+@functools.lru_cache(maxsize=4096)
+def _to_dec(s: str) -> Decimal:
+    return Decimal(s)
+
+
+# 📢 [수정] 키 입력마다 호출되므로 상수는 모듈 수준에 두고, 같은 입력은 캐시된 결과를 재사용합니다.
+@functools.lru_cache(maxsize=128)
 def calculate_target_price(
-        entry_price: Decimal, leverage: Decimal, target_roi_percent: Decimal, position_type: str, fee_rate: Decimal
+        entry_price: Decimal, leverage: Decimal, target_roi_percent: Decimal, is_long: bool, fee_rate: Decimal
 ) -> Decimal:
-    target_roi = target_roi_percent / Decimal('100.0')
-    if position_type.lower() == 'long':
-        return entry_price * (Decimal('1') + (target_roi / leverage) + fee_rate) / (Decimal('1') - fee_rate)
-    elif position_type.lower() == 'short':
-        return entry_price * (Decimal('1') - (target_roi / leverage) - fee_rate) / (Decimal('1') + fee_rate)
-    raise ValueError("Position type must be 'long' or 'short'")
+    r = target_roi_percent / _DEC_100 / leverage
+    if is_long:
+        return entry_price * (_DEC_1 + r + fee_rate) / (_DEC_1 - fee_rate)
+    return entry_price * (_DEC_1 - r - fee_rate) / (_DEC_1 + fee_rate)
 
 
 # --- GUI 애플리케이션 클래스 (절대값 통일 및 로그 레벨 세분화) ---
 class BinanceCalculatorApp(QWidget):
+    # 📢 [추가] 포지션 행 HTML 템플릿 (값은 미리 포맷된 문자열로 채움)
+    _POS_TEMPLATE = ("<b style='font-size:11pt;'>%(symbol)s <span style='color:%(position_color)s;'>(%(position_side)s)</span></b><br>"
+                     " - <b>수익(nPNL):</b> <span style='color:%(net_color)s;'><b>$%(net_pnl)s</b></span><br>"
+                     " - <b>수익률(nROE):</b> <span style='color:%(net_color)s;'><b>%(net_roe)s</b></span><br>"
+                     " - <b>진입가:</b> $%(entry_price)s<br>"
+                     " - <b>시장가:</b> $%(mark_price)s<br>"
+                     " - <b>청산가:</b> <span style='color:orange;'>$%(liq_price)s</span><br>"
+                     " - <b>수량:</b> %(quantity)s<br>"
+                     "--------------------------<br>")
+
     def __init__(self):
         super().__init__()
 
@@ -186,12 +316,18 @@ class BinanceCalculatorApp(QWidget):
             create_default_config()
             self.config.read('config.ini', encoding='utf-8')
 
+        self._load_config_values()
+
         self.setWindowTitle("Binance Station Alpha V1.0 (Live Mode)")
         self.setGeometry(100, 100, 900, 850)
 
         try:
             self.client = Client(config.API_KEY, config.SECRET_KEY)
             self.client.API_URL = self.config.get('API', 'api_url')
+            # 📢 [추가] 스레드 풀/긴급 청산의 동시 REST 호출이 TLS 연결을 재사용하도록 커넥션 풀을 늘립니다.
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+            self.client.session.mount('https://', adapter)
+            self.client.session.headers['Connection'] = 'keep-alive'
             self.client.futures_ping()
             logging.info("바이낸스 실제 서버 클라이언트 초기화 성공.")
         except Exception as e:
@@ -203,21 +339,54 @@ class BinanceCalculatorApp(QWidget):
         self.position_type = None
         self.worker_thread = None
         self.worker = None
-        self.available_balance = Decimal('0')
-        self.best_ask_price = Decimal('0')
-        self.best_bid_price = Decimal('0')
+        self.available_balance = _DEC_0
+        self.best_ask_price = _DEC_0
+        self.best_bid_price = _DEC_0
         self.symbol_info = {}
-        self.tick_size = Decimal('0')
-        self.step_size = Decimal('0')
+        self.tick_size = _DEC_0
+        self.step_size = _DEC_0
         self.latest_order_book_data = {}
+        # 📢 [추가] Tick Size 기반 가격 정밀도/포맷은 종목 정보 로드 시 한 번만 계산합니다.
+        self.price_precision = None # Tick Size 정보가 없으면 None
+        self.price_format = ",.2f" # 미체결 주문/포지션 가격 표시용
+        self.order_book_format = "{:,.4f} ({:.3f})" # 호가 표시용
+        self._last_rendered_ob = None
+        self._ob_dirty = False # 📢 [추가] 상위 5호가가 바뀌었을 때만 UI를 다시 그립니다.
+        self._ob_top = None
+        self._target_button_ready = None
+        self._last_display_text = {} # 📢 [추가] 위젯별 마지막 표시 문자열 (같으면 setHtml/setText 생략)
+        # 📢 [추가] 파싱된 입력값 캐시 (숫자가 아니거나 비어 있으면 None)
+        self._entry_dec = None
+        self._lev_dec = None
+        self._roi_dec = None
         self.leverage_brackets = []
+        # 📢 [추가] 거래소 정보는 심볼별로 색인해 1시간 동안 재사용하고, 레버리지 구간은 심볼별로 처음 한 번만 조회합니다.
+        self._exchange_info_by_symbol = {}
+        self._filters_by_symbol = {} # 심볼 -> {filterType: filter}
+        self._exchange_info_time = 0.0
+        self._brackets_by_symbol = {}
         self.is_retry_scheduled = False
         self.calculated_target_price_decimal = None 
+        self._target_args = None # 📢 [추가] 주문 시 Decimal로 목표가를 확정하기 위한 입력값
+        self._target_preview = None # 화면에 표시된 float 목표가
+        self._last_target_key = None # 📢 [추가] 마지막으로 표시한 목표가의 입력값 (같으면 재계산 생략)
         
-        # 📢 [추가] WebSocket 재연결을 위한 QTimer
-        self.reconnect_timer = QTimer(self)
-        self.reconnect_timer.setSingleShot(True)
-        self.reconnect_timer.timeout.connect(self.start_worker)
+
+        # 📢 [추가] REST 호출은 스레드 풀에서 실행하고, UI 반영만 메인 스레드에서 수행합니다.
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        self._invoker = MainThreadInvoker()
+        self._inflight = set()
+
+        # 📢 [추가] 입력 중 연속 호출을 50ms 단위로 묶어 목표가를 한 번만 계산합니다.
+        self._calc_debounce = QTimer(self)
+        self._calc_debounce.setSingleShot(True)
+        self._calc_debounce.setInterval(50)
+        self._calc_debounce.timeout.connect(self._do_calc_and_display)
+        # 📢 [추가] 슬라이더 드래그 중에는 30ms 동안 멈췄을 때의 값으로만 수량을 계산합니다.
+        self._slider_debounce = QTimer(self)
+        self._slider_debounce.setSingleShot(True)
+        self._slider_debounce.setInterval(30)
+        self._slider_debounce.timeout.connect(self._apply_slider_value)
 
         self.initUI()
         self.start_worker()
@@ -225,8 +394,8 @@ class BinanceCalculatorApp(QWidget):
         self.fetch_symbol_info()
 
         self.position_timer = QTimer(self)
-        self.position_timer.timeout.connect(self.update_position_status)
-        self.position_timer.timeout.connect(self.update_open_orders_status)
+        self._tick = 0
+        self.position_timer.timeout.connect(self.refresh_account_cycle)
         self.position_timer.start(self.config.getint('APP_SETTINGS', 'position_update_interval_ms'))
 
         self.ui_update_timer = QTimer(self)
@@ -239,18 +408,30 @@ class BinanceCalculatorApp(QWidget):
         SIDE는 포지션에 따라 자동으로 결정되며, 가격은 보수적으로 조정됩니다.
         """
         symbol = self.current_selected_symbol
+        if not self._check_symbol_info_ready(symbol):
+            return
+        # 📢 [수정] 포지션 조회와 주문 전송은 스레드 풀에서 실행하고, 결과는 메인 스레드에서 처리합니다.
+        # 1. 현재 포지션 정보 확인
+        self.run_rest_async(('limit_close', symbol),
+                            lambda: self.client.futures_position_information(symbol=symbol),
+                            lambda f: self._submit_limit_close_order(symbol, f))
+
+    def _submit_limit_close_order(self, symbol, future):
+        # 📢 [추가] 포지션 조회 중에 종목이 바뀌었으면 Tick/Step이 다른 종목 기준이므로 주문하지 않습니다.
+        if not self._check_symbol_info_ready(symbol):
+            return
 
         try:
-            # 1. 현재 포지션 정보 확인
-            positions = self.client.futures_position_information(symbol=symbol)
-            open_position = next((p for p in positions if Decimal(p['positionAmt']) != Decimal('0')), None)
+            positions = future.result()
+            # 📢 [수정] 행마다 숫자로 변환하지 않고 문자열로 0 여부만 확인합니다.
+            open_position = next((p for p in positions if _nonzero_amt(p['positionAmt'])), None)
 
             if not open_position:
                 QMessageBox.warning(self, "청산 오류", "현재 청산할 포지션이 없습니다.")
                 return
 
             position_amt = Decimal(open_position['positionAmt'])
-            position_side = "LONG" if position_amt > Decimal('0') else "SHORT"
+            position_side = "LONG" if not position_amt.is_signed() else "SHORT"
 
             # 2. 주문 SIDE 결정 (포지션과 반대)
             side = Client.SIDE_SELL if position_side == "LONG" else Client.SIDE_BUY
@@ -269,13 +450,13 @@ class BinanceCalculatorApp(QWidget):
             price = Decimal(limit_price_text)
 
             # 📢 [수정] 청산 주문 시 보수적인 가격 조정 로직 적용
-            if self.tick_size > Decimal('0'):
+            if self.tick_size > _DEC_0:
                 if position_side == 'LONG':
                     # 롱 포지션 청산 (SELL): 가격을 올려야 (CEILING) 보수적
-                    adjusted_price = price.quantize(self.tick_size, rounding=ROUND_CEILING)
+                    adjusted_price = align_to_step(price, self.tick_size, ROUND_CEILING)
                 else:
                     # 숏 포지션 청산 (BUY): 가격을 내려야 (FLOOR) 보수적
-                    adjusted_price = price.quantize(self.tick_size, rounding=ROUND_FLOOR)
+                    adjusted_price = align_to_step(price, self.tick_size, ROUND_FLOOR)
             else:
                 adjusted_price = price # Tick Size 정보가 없으면 조정하지 않음
             
@@ -286,7 +467,7 @@ class BinanceCalculatorApp(QWidget):
             else:
                 quantity = Decimal(quantity_text)
 
-            if price <= Decimal('0') or quantity <= Decimal('0'):
+            if price <= _DEC_0 or quantity <= _DEC_0:
                 QMessageBox.warning(self, "주문 오류", "가격과 수량은 0보다 커야 합니다.")
                 return
             
@@ -300,17 +481,29 @@ class BinanceCalculatorApp(QWidget):
                 return
 
             # 5. Binance API 호출
-            order = self.client.futures_create_order(
-                symbol=symbol,
-                side=side,
-                type=Client.ORDER_TYPE_LIMIT,
-                timeInForce=Client.TIME_IN_FORCE_GTC,
-                quantity=adjusted_quantity.normalize(), # 조정된 수량 사용
-                price=str(adjusted_price.normalize()), # 조정된 가격 사용
-                # 명시적 청산을 위해 reduceOnly=True를 사용합니다.
-                reduceOnly=True
-            )
+            self.run_rest_async(('limit_close_order', symbol),
+                                lambda: self.client.futures_create_order(
+                                    symbol=symbol,
+                                    side=side,
+                                    type=Client.ORDER_TYPE_LIMIT,
+                                    timeInForce=Client.TIME_IN_FORCE_GTC,
+                                    quantity=f"{adjusted_quantity:f}", # 조정된 수량 사용
+                                    price=f"{adjusted_price:f}", # 조정된 가격 사용
+                                    # 명시적 청산을 위해 reduceOnly=True를 사용합니다.
+                                    reduceOnly=True
+                                ),
+                                lambda f: self._on_limit_close_done(symbol, position_side, side, adjusted_quantity, f))
 
+        except BinanceAPIException as e:
+            logging.error(f"LIMIT 청산 주문 실패: {e}", exc_info=True)
+            QMessageBox.critical(self, "주문 실패", f"LIMIT 청산 주문 실패: {e.message}")
+        except Exception as e:
+            logging.error(f"LIMIT 청산 주문 중 일반 오류 발생: {e}", exc_info=True)
+            QMessageBox.critical(self, "오류", f"LIMIT 청산 주문 중 오류 발생: {e}")
+
+    def _on_limit_close_done(self, symbol, position_side, side, adjusted_quantity, future):
+        try:
+            order = future.result()
             logging.info(f"LIMIT 청산 주문 제출 성공 (SIDE: {side}, 수량: {adjusted_quantity}): {order}")
             QMessageBox.information(
                 self,
@@ -333,10 +526,14 @@ class BinanceCalculatorApp(QWidget):
         현재 선택된 종목의 모든 미체결 주문을 취소하고 상태를 새로고침합니다.
         """
         symbol = self.current_selected_symbol
+        # 💡 [핵심 로직] Binance API 호출: 전체 미체결 주문 취소 (스레드 풀에서 실행)
+        self.run_rest_async(('cancel_all', symbol),
+                            lambda: self.client.futures_cancel_all_open_orders(symbol=symbol),
+                            lambda f: self._on_cancel_all_done(symbol, f))
 
+    def _on_cancel_all_done(self, symbol, future):
         try:
-            # 💡 [핵심 로직] Binance API 호출: 전체 미체결 주문 취소
-            result = self.client.futures_cancel_all_open_orders(symbol=symbol)
+            result = future.result()
 
             # API 응답 확인 및 로그
             if result.get('code') == 200:
@@ -404,7 +601,9 @@ class BinanceCalculatorApp(QWidget):
         self.entry_price_input = QLineEdit(self)
         self.entry_price_input.setValidator(QDoubleValidator(0.0, 1e9, 8))
         self.entry_price_input.setText("0.00")
+        self.entry_price_input.textChanged.connect(self._cache_inputs)
         self.entry_price_input.textChanged.connect(self.calculate_and_display_target)
+        self.entry_price_input.editingFinished.connect(self._cache_inputs)
         self.entry_price_input.editingFinished.connect(self.format_entry_price) # ✅ focusOut 시점에만 조정
         entry_price_layout.addWidget(entry_price_label)
         entry_price_layout.addWidget(self.entry_price_input)
@@ -416,7 +615,9 @@ class BinanceCalculatorApp(QWidget):
         self.leverage_input = QLineEdit(self)
         self.leverage_input.setValidator(QDoubleValidator(1.0, 125.0, 0))
         self.leverage_input.setText("10")
+        self.leverage_input.textChanged.connect(self._cache_inputs)
         self.leverage_input.textChanged.connect(self.calculate_and_display_target)
+        self.leverage_input.editingFinished.connect(self._cache_inputs)
         leverage_layout.addWidget(self.leverage_label)
         leverage_layout.addWidget(self.leverage_input)
         input_form_layout.addLayout(leverage_layout)
@@ -426,7 +627,9 @@ class BinanceCalculatorApp(QWidget):
         self.roi_input = QLineEdit(self)
         self.roi_input.setValidator(QDoubleValidator(0.01, 1e6, 2))
         self.roi_input.setText("10")
+        self.roi_input.textChanged.connect(self._cache_inputs)
         self.roi_input.textChanged.connect(self.calculate_and_display_target)
+        self.roi_input.editingFinished.connect(self._cache_inputs)
         roi_layout.addWidget(roi_label)
         roi_layout.addWidget(self.roi_input)
         input_form_layout.addLayout(roi_layout)
@@ -634,19 +837,47 @@ class BinanceCalculatorApp(QWidget):
         grid.setColumnStretch(1, 3)
 
         self.update_button_style()
+        self._cache_inputs()
         self.calculate_and_display_target()
         # 📢 [추가] 초기 Target Price 버튼 상태 설정
         self.place_target_order_button.setEnabled(False)
+        self._target_button_ready = False
 
 
-    def buffer_order_book_data(self, data):
+    def buffer_order_book_data(self, symbol, data):
+        # 📢 [추가] 구독 전환 직후 도착한 이전 심볼의 프레임은 무시합니다.
+        if symbol != self.current_selected_symbol:
+            return
+        # 📢 [수정] depth5 스트림의 호가 키는 'a'/'b' 입니다. 호가가 없는 프레임은 건너뜁니다.
+        asks = data.get('a')
+        bids = data.get('b')
+        if asks is None and bids is None:
+            return
+        asks = asks or []
+        bids = bids or []
         self.latest_order_book_data = data
-        if data.get('asks'):
-            self.best_ask_price = Decimal(data['asks'][0][0])
-        if data.get('bids'):
-            self.best_bid_price = Decimal(data['bids'][0][0])
+        # 📢 [수정] 표시되는 상위 5호가(가격/수량)가 바뀐 경우에만 dirty 표시
+        top = (asks[:5], bids[:5])
+        if top != self._ob_top:
+            self._ob_top = top
+            self._ob_dirty = True
+        if asks:
+            self.best_ask_price = _to_dec(asks[0][0])
+        if bids:
+            self.best_bid_price = _to_dec(bids[0][0])
 
     def update_ui_from_buffer(self):
+        # 📢 [수정] 워커가 보관한 최신 프레임을 가져옵니다. (없으면 이전 데이터 유지)
+        if self.worker:
+            try:
+                symbol, data = self.worker.latest_data.popleft()
+                self.buffer_order_book_data(symbol, data)
+            except IndexError:
+                pass
+        # 📢 [수정] 바뀐 호가가 없으면 라벨을 건드리지 않습니다.
+        if not self._ob_dirty:
+            return
+        self._ob_dirty = False
         if self.latest_order_book_data:
             self.update_order_book_ui(self.latest_order_book_data)
         
@@ -655,37 +886,36 @@ class BinanceCalculatorApp(QWidget):
 
 
     def update_order_book_ui(self, data):
+        # 📢 [수정] 이미 그린 데이터면 다시 그리지 않습니다.
+        if data is self._last_rendered_ob:
+            return
+        self._last_rendered_ob = data
+
         asks = data.get('a', [])
         bids = data.get('b', [])
-        
-        # [수정] 호가 정보의 틱 사이즈에 맞는 정밀도를 결정합니다.
-        precision = 4 # 기본값 (대부분의 코인이 4-5자리)
-        if self.tick_size > Decimal('0'):
-            precision = max(0, -self.tick_size.as_tuple().exponent) # 소수점 자릿수 계산
-            
-        format_string = f"{{:,.{precision}f}} ({{:.3f}})"
-
-        for i, label in enumerate(self.ask_price_labels):
-            if i < len(asks):
-                label.setText(format_string.format(Decimal(asks[i][0]), Decimal(asks[i][1])))
-            else:
-                label.setText("N/A")
-        for i, label in enumerate(self.bid_price_labels):
-            if i < len(bids):
-                label.setText(format_string.format(Decimal(bids[i][0]), Decimal(bids[i][1])))
-            else:
-                label.setText("N/A")
+        # 표시 전용이므로 Decimal 대신 float로 변환 (포맷은 fetch_symbol_info에서 미리 계산)
+        format_string = self.order_book_format
+        ask_texts = [format_string.format(float(p), float(q)) for p, q in asks[:5]]
+        bid_texts = [format_string.format(float(p), float(q)) for p, q in bids[:5]]
+        ask_texts += ["N/A"] * (len(self.ask_price_labels) - len(ask_texts))
+        bid_texts += ["N/A"] * (len(self.bid_price_labels) - len(bid_texts))
+
+        # 📢 [수정] 10개 라벨을 갱신하는 동안 그리기를 멈췄다가 한 번에 다시 그립니다.
+        self.order_book_group_box.setUpdatesEnabled(False)
+        try:
+            for label, text in zip(self.ask_price_labels, ask_texts):
+                label.setText(text)
+            for label, text in zip(self.bid_price_labels, bid_texts):
+                label.setText(text)
+        finally:
+            self.order_book_group_box.setUpdatesEnabled(True)
 
     def start_worker(self):
-        # 📢 [수정] 재연결 타이머가 실행 중이면 중지합니다.
-        if self.reconnect_timer.isActive():
-            self.reconnect_timer.stop()
-            
         if self.worker_thread and self.worker_thread.isRunning():
             self.stop_worker()
             
         ws_uri = self.config.get('API', 'websocket_base_uri')
-        self.worker = BinanceWorker(self.current_selected_symbol, ws_uri)
+        self.worker = BinanceWorker([self.current_selected_symbol], ws_uri)
         self.worker_thread = QThread()
         self.worker.moveToThread(self.worker_thread)
         
@@ -693,7 +923,6 @@ class BinanceCalculatorApp(QWidget):
         self.worker_thread.started.connect(self.worker.run)
         self.worker_thread.finished.connect(lambda: logging.debug(f"{self.worker.symbol} WebSocket 스레드 종료됨.")) 
         
-        self.worker.data_received.connect(self.buffer_order_book_data)
         self.worker.connection_error.connect(self.handle_connection_error)
         self.worker_thread.start()
 
@@ -710,10 +939,32 @@ class BinanceCalculatorApp(QWidget):
         logging.info("애플리케이션을 종료합니다.")
         self.position_timer.stop()
         self.ui_update_timer.stop()
-        self.reconnect_timer.stop() # 📢 [추가] 타이머 중지
         self.stop_worker()
+        self._pool.shutdown(wait=False)
         event.accept()
 
+    def run_rest_async(self, key, fn, on_done):
+        """
+        📢 [추가] 블로킹 REST 호출 fn()을 스레드 풀에서 실행하고, on_done(future)을 메인 스레드에서 호출합니다.
+        같은 key의 요청이 아직 진행 중이면 중복 요청하지 않습니다.
+        """
+        if key in self._inflight:
+            return
+        self._inflight.add(key)
+
+        def finish(future):
+            self._inflight.discard(key)
+            on_done(future)
+
+        self._pool.submit(fn).add_done_callback(lambda f: self._invoker.invoke.emit(lambda: finish(f)))
+
+    def refresh_account_cycle(self):
+        """📢 [추가] 타이머 1회당 REST 호출 1~2회: 포지션은 매 주기, 미체결 주문은 2주기마다 갱신합니다."""
+        self.update_position_status()
+        self._tick = (self._tick + 1) % 2
+        if self._tick == 0:
+            self.update_open_orders_status()
+
     def retry_position_update(self):
         """2초 후 포지션 정보만 조용히 다시 가져옵니다."""
         logging.debug("누락된 포지션 정보를 자동으로 다시 가져옵니다...")
@@ -731,109 +982,121 @@ class BinanceCalculatorApp(QWidget):
         self.update_position_status()
         self.update_open_orders_status()
 
+    def _set_display(self, widget, text, html=True):
+        """📢 [추가] 내용이 바뀐 경우에만 QTextEdit를 다시 그립니다. (HTML 파싱/레이아웃 비용 절감)"""
+        if self._last_display_text.get(widget) == text:
+            return
+        self._last_display_text[widget] = text
+        if html:
+            widget.setHtml(text)
+        else:
+            widget.setText(text)
+
     def update_open_orders_status(self):
+        symbol = self.current_selected_symbol
+        self.run_rest_async(('open_orders', symbol),
+                            lambda: self.client.futures_get_open_orders(symbol=symbol),
+                            lambda f: self._apply_open_orders(symbol, f))
+
+    def _apply_open_orders(self, symbol, future):
+        if symbol != self.current_selected_symbol:
+            return # 응답 도착 전에 종목이 바뀐 경우 무시
         try:
-            orders = self.client.futures_get_open_orders(symbol=self.current_selected_symbol)
+            orders = future.result()
             if not orders:
-                self.open_orders_display.setText(f"현재 {self.current_selected_symbol} 미체결 주문 없음")
+                self._set_display(self.open_orders_display, f"현재 {self.current_selected_symbol} 미체결 주문 없음", html=False)
                 return
-            display_text = ""
-            # [수정] 가격 포맷팅을 위한 precision 계산
-            precision = 2 
-            if self.tick_size > Decimal('0'):
-                precision = max(0, -self.tick_size.as_tuple().exponent)
-            price_format = f",.{precision}f"
+            parts = [] # 📢 [수정] 문자열 += 대신 리스트에 모아 한 번에 join
+            price_format = self.price_format # 📢 [수정] fetch_symbol_info에서 계산된 포맷 사용
             
             for o in orders:
                 side_color = "red" if o['side'] == 'SELL' else "blue"
-                display_text += (f"<b style='font-size:11pt;'>{o['symbol']} <span style='color:{side_color}';>{o['side']}</span></b><br>"
-                                 f" - <b>가격:</b> ${Decimal(o['price']):{price_format}}<br>"
-                                 f" - <b>수량:</b> {Decimal(o['origQty'])}<br>"
-                                 "--------------------------<br>")
-            self.open_orders_display.setHtml(display_text)
+                parts.append(f"<b style='font-size:11pt;'>{o['symbol']} <span style='color:{side_color}';>{o['side']}</span></b><br>"
+                             f" - <b>가격:</b> ${Decimal(o['price']):{price_format}}<br>"
+                             f" - <b>수량:</b> {Decimal(o['origQty'])}<br>"
+                             "--------------------------<br>")
+            self._set_display(self.open_orders_display, "".join(parts))
         except Exception as e:
             logging.error(f"미체결 주문 로드 실패: {e}", exc_info=True)
-            self.open_orders_display.setText(f"미체결 주문 로드 실패:\n{e}")
+            self._set_display(self.open_orders_display, f"미체결 주문 로드 실패:\n{e}", html=False)
 
     def update_position_status(self):
+        symbol = self.current_selected_symbol
+        self.run_rest_async(('positions', symbol),
+                            lambda: self.client.futures_position_information(symbol=symbol),
+                            lambda f: self._apply_position_status(symbol, f))
+
+    def _apply_position_status(self, symbol, future):
+        if symbol != self.current_selected_symbol:
+            return # 응답 도착 전에 종목이 바뀐 경우 무시
         try:
-            positions = self.client.futures_position_information(symbol=self.current_selected_symbol)
-            open_positions = [p for p in positions if Decimal(p['positionAmt']) != Decimal('0')]
+            positions = future.result()
+            open_positions = [p for p in positions if _nonzero_amt(p['positionAmt'])]
 
             if not open_positions:
-                self.position_display.setText(f"현재 {self.current_selected_symbol} 포지션이 없습니다.")
+                self._set_display(self.position_display, f"현재 {self.current_selected_symbol} 포지션이 없습니다.", html=False)
                 return
 
-            # [추가] 포지션 관련 가격 포맷팅을 위한 precision 계산
-            precision = 2 
-            if self.tick_size > Decimal('0'):
-                precision = max(0, -self.tick_size.as_tuple().exponent)
-            price_format = f",.{precision}f"
+            price_format = self.price_format # 📢 [수정] fetch_symbol_info에서 계산된 포맷 사용
             
-            display_text = ""
+            parts = [] # 📢 [수정] 문자열 += 대신 리스트에 모아 한 번에 join
             for p in open_positions:
                 pnl = Decimal(p['unRealizedProfit'])
                 entry_price = Decimal(p['entryPrice'])
                 position_amt = Decimal(p['positionAmt'])
+                abs_amt = abs(position_amt) # 📢 [수정] 절대값은 한 번만 계산해 재사용
                 mark_price = Decimal(p['markPrice'])
-                position_side = "LONG" if position_amt > 0 else "SHORT"
+                is_long = not position_amt.is_signed() # 0 수량은 위에서 걸러지므로 부호만 확인
+                position_side = "LONG" if is_long else "SHORT"
                 liq_price = Decimal(p['liquidationPrice'])
                 
                 # 포지션 타입 색상 결정 (이전 요청 유지: LONG=빨강, SHORT=파랑)
-                position_color = "red" if position_side == "LONG" else "blue"
+                position_color = "red" if is_long else "blue"
 
-                taker_fee_rate = Decimal(self.config.get('TRADING', 'taker_fee_rate'))
-                # 📢 [수정] copy_abs() 대신 abs() 사용
-                position_notional = mark_price * abs(position_amt)
+                taker_fee_rate = self._taker_fee_rate
+                position_notional = mark_price * abs_amt
                 closing_fee = position_notional * taker_fee_rate
 
                 net_pnl = pnl - closing_fee
                 # 📢 [핵심 수정] nPNL/nROE 색상 로직 적용 (양수: 초록색, 음수: 검정색)
-                net_color = "green" if net_pnl >= Decimal('0') else "black" 
+                net_color = "green" if net_pnl >= _DEC_0 else "black" 
 
                 # 🔑 레버리지 확보 로직 
                 leverage_str = p.get('leverage')
-                leverage = Decimal('0')
+                leverage = _DEC_0
                 net_roe_text = "N/A"
 
                 # 1. API 응답에 있으면: 가장 정확한 값 사용
                 if leverage_str:
                     leverage = Decimal(leverage_str)
                 # 2. API 응답에 없으면: UI 입력값으로 보조
-                elif self.leverage_input.text():
-                    try:
-                        leverage = Decimal(self.leverage_input.text())
-                        logging.warning(f"포지션 leverage 키 누락! UI 입력값 {leverage}x로 nROE 계산 보완.")
-                    except:
-                        pass
+                elif self._lev_dec is not None:
+                    leverage = self._lev_dec
+                    logging.warning(f"포지션 leverage 키 누락! UI 입력값 {leverage}x로 nROE 계산 보완.")
 
 
                 # nROE 계산
-                if leverage > Decimal('0'):
-                    # 📢 [수정] copy_abs() 대신 abs() 사용
-                    margin = entry_price * abs(position_amt) / leverage
-                    if margin != Decimal('0'):
-                        net_roe = (net_pnl / margin) * Decimal('100')
+                if leverage > _DEC_0:
+                    margin = entry_price * abs_amt / leverage
+                    if not margin.is_zero():
+                        net_roe = (net_pnl / margin) * _DEC_100
                         net_roe_text = f"{net_roe:.2f}%"
                     else:
                         net_roe_text = "0.00%"
                 # ----------------------------------------
                 
                 # 포지션 타입에 position_color 적용 및 nPNL/nROE 볼드 처리 유지
-                # 📢 [수정] copy_abs() 대신 abs() 사용
-                display_text += (f"<b style='font-size:11pt;'>{p['symbol']} <span style='color:{position_color};'>({position_side})</span></b><br>"
-                                 f" - <b>수익(nPNL):</b> <span style='color:{net_color};'><b>${net_pnl:,.2f}</b></span><br>"
-                                 f" - <b>수익률(nROE):</b> <span style='color:{net_color};'><b>{net_roe_text}</b></span><br>"
-                                 f" - <b>진입가:</b> ${entry_price:{price_format}}<br>"
-                                 f" - <b>시장가:</b> ${mark_price:{price_format}}<br>"
-                                 f" - <b>청산가:</b> <span style='color:orange;'>${liq_price:{price_format}}</span><br>"
-                                 f" - <b>수량:</b> {abs(position_amt)}<br>"
-                                 f"--------------------------<br>")
-            self.position_display.setHtml(display_text)
+                parts.append(self._POS_TEMPLATE % {
+                    'symbol': p['symbol'], 'position_color': position_color, 'position_side': position_side,
+                    'net_color': net_color, 'net_pnl': format(net_pnl, ',.2f'), 'net_roe': net_roe_text,
+                    'entry_price': format(entry_price, price_format), 'mark_price': format(mark_price, price_format),
+                    'liq_price': format(liq_price, price_format), 'quantity': abs_amt,
+                })
+            self._set_display(self.position_display, "".join(parts))
 
         except Exception as e:
             logging.error(f"포지션 정보 로드 실패: {e}", exc_info=True)
-            self.position_display.setText(f"포지션 정보 로드 실패:\n{e}")
+            self._set_display(self.position_display, f"포지션 정보 로드 실패:\n{e}", html=False)
 
     def format_entry_price(self):
         """
@@ -845,7 +1108,7 @@ class BinanceCalculatorApp(QWidget):
                 return
             price = Decimal(price_str)
             
-            if self.tick_size > Decimal('0'):
+            if self.tick_size > _DEC_0:
                 # 입력 종료 시점에만 반올림으로 조정 (ROUND_HALF_UP)
                 adjusted_price = price.quantize(self.tick_size, rounding=ROUND_HALF_UP)
             else:
@@ -859,48 +1122,122 @@ class BinanceCalculatorApp(QWidget):
             pass
 
     def adjust_quantity(self, quantity: Decimal) -> Decimal:
-        if self.step_size == Decimal('0'):
+        if self.step_size == _DEC_0:
             return quantity
-        # 수량 조정 시에는 항상 소수점을 내림하여 보수적으로 처리합니다.
-        return quantity.quantize(self.step_size, rounding=ROUND_DOWN)
+        # 수량 조정 시에는 항상 Step Size 단위로 내림하여 보수적으로 처리합니다.
+        return align_to_step(quantity, self.step_size, ROUND_DOWN)
 
     def fetch_symbol_info(self):
+        symbol = self.current_selected_symbol
+        # 📢 [추가] 새 종목 정보가 도착하기 전에는 이전 종목의 Tick/Step Size·레버리지 구간으로 주문하지 않도록 초기화
+        self.symbol_info = {}
+        self.tick_size = _DEC_0
+        self.step_size = _DEC_0
+        self.leverage_brackets = []
+
+        info_stale = not self._exchange_info_by_symbol or time.monotonic() - self._exchange_info_time > EXCHANGE_INFO_TTL
+        if not info_stale and symbol in self._brackets_by_symbol:
+            self._load_symbol_info(symbol) # 캐시 적중: REST 호출 없이 바로 반영
+            return
+
+        def fetch():
+            info_by_symbol = filters_by_symbol = None
+            if info_stale:
+                info_by_symbol = {s['symbol']: s for s in self.client.futures_exchange_info()['symbols']}
+                filters_by_symbol = {sym: {f['filterType']: f for f in s['filters']} for sym, s in info_by_symbol.items()}
+            brackets = None
+            if symbol not in self._brackets_by_symbol:
+                leverage_brackets_data = self.client.futures_leverage_bracket(symbol=symbol)
+                # 📢 [추가] 구간 경계/레버리지는 캐시할 때 한 번만 Decimal로 변환합니다. (floor, cap, initialLeverage)
+                brackets = [(Decimal(str(t['notionalFloor'])), Decimal(str(t['notionalCap'])), Decimal(str(t['initialLeverage'])))
+                            for t in leverage_brackets_data[0]['brackets']] if leverage_brackets_data else []
+            return info_by_symbol, filters_by_symbol, brackets
+
+        self.run_rest_async(('symbol_info', symbol), fetch, lambda f: self._apply_symbol_info(symbol, f))
+
+    def _apply_symbol_info(self, symbol, future):
         try:
-            info = self.client.futures_exchange_info()
-            for s in info['symbols']:
-                if s['symbol'] == self.current_selected_symbol:
-                    self.symbol_info = s
-                    for f in s['filters']:
-                        if f['filterType'] == 'PRICE_FILTER':
-                            # 👇 [핵심 수정] normalize()를 사용하여 불필요한 후행 0의 정밀도를 제거합니다.
-                            self.tick_size = Decimal(f['tickSize']).normalize() 
-                            logging.debug(f"✅ {self.current_selected_symbol} Tick Size Fetched: {self.tick_size}")
-                        if f['filterType'] == 'LOT_SIZE':
-                            self.step_size = Decimal(f['stepSize'])
-
-            leverage_brackets_data = self.client.futures_leverage_bracket(symbol=self.current_selected_symbol)
-            if leverage_brackets_data:
-                self.leverage_brackets = leverage_brackets_data[0]['brackets']
-                max_leverage = int(self.leverage_brackets[0]['initialLeverage'])
+            info_by_symbol, filters_by_symbol, brackets = future.result()
+        except Exception as e:
+            logging.error(f"종목 정보 로드 실패: {e}", exc_info=True)
+            # 📢 [수정] 조회 실패 시 symbol_info는 비워 둔 채로 두어 주문을 막고, 다음 주문 시도에서 다시 조회합니다.
+            if symbol == self.current_selected_symbol:
+                self.leverage_brackets = []
+            return
+        if info_by_symbol is not None:
+            self._exchange_info_by_symbol = info_by_symbol
+            self._filters_by_symbol = filters_by_symbol
+            self._exchange_info_time = time.monotonic()
+        if brackets is not None:
+            self._brackets_by_symbol[symbol] = brackets
+        if symbol != self.current_selected_symbol:
+            return # 응답 도착 전에 종목이 바뀐 경우 캐시만 채우고 UI에는 반영하지 않음
+        self._load_symbol_info(symbol)
+
+    def _check_symbol_info_ready(self, symbol=None, title="주문 오류"):
+        """
+        📢 [추가] 현재 종목의 Tick/Step Size·레버리지 구간이 반영되었는지 확인합니다.
+        아직이면 경고를 띄우고, 진행 중인 조회가 없으면(이전 조회 실패 등) 다시 요청합니다.
+        """
+        symbol = symbol or self.current_selected_symbol
+        if self.symbol_info.get('symbol') == symbol:
+            return True
+        QMessageBox.warning(self, title, "종목 정보를 불러오는 중입니다. 잠시 후 다시 시도해주세요.")
+        if symbol == self.current_selected_symbol and ('symbol_info', symbol) not in self._inflight:
+            self.fetch_symbol_info()
+        return False
+
+    def _load_symbol_info(self, symbol):
+        try:
+            s = self._exchange_info_by_symbol[symbol]
+            self.symbol_info = s
+            self._last_target_key = None # Tick Size가 바뀌면 목표가 반올림도 달라집니다.
+            flt = self._filters_by_symbol[symbol]
+            # 👇 [핵심 수정] normalize()를 사용하여 불필요한 후행 0의 정밀도를 제거합니다.
+            self.tick_size = Decimal(flt['PRICE_FILTER']['tickSize']).normalize()
+            self.step_size = Decimal(flt['LOT_SIZE']['stepSize'])
+            logging.debug(f"✅ {symbol} Tick Size Fetched: {self.tick_size}")
+            # 📢 [추가] 가격 표시 정밀도는 심볼 변경 시에만 계산합니다. (Tick Size 0이면 기본값 유지)
+            if self.tick_size > _DEC_0:
+                self.price_precision = max(0, -self.tick_size.as_tuple().exponent)
+                self.price_format = f",.{self.price_precision}f"
+                self.order_book_format = f"{{:,.{self.price_precision}f}} ({{:.3f}})"
+            else:
+                self.price_precision = None
+                self.price_format = ",.2f"
+                self.order_book_format = "{:,.4f} ({:.3f})"
+
+            brackets = self._brackets_by_symbol.get(symbol)
+            # 📢 [수정] 구간 정보가 없으면 이전 종목의 구간/레버리지 제한을 남기지 않습니다.
+            self.leverage_brackets = brackets or []
+            if not brackets:
+                self.leverage_input.setValidator(QDoubleValidator(1.0, 125.0, 0))
+                self.leverage_label.setToolTip("종목 변경 시 최대 레버리지가 자동으로 설정됩니다.")
+            else:
+                max_leverage = int(self.leverage_brackets[0][2])
                 logging.debug(
-                    f"{self.current_selected_symbol} 정보 로드: Tick Size {self.tick_size}, Step Size {self.step_size}, Max Leverage {max_leverage}x")
+                    f"{symbol} 정보 로드: Tick Size {self.tick_size}, Step Size {self.step_size}, Max Leverage {max_leverage}x")
                 self.leverage_input.setValidator(QDoubleValidator(1.0, float(max_leverage), 0))
                 self.leverage_label.setToolTip(f"이 종목의 최대 레버리지는 {max_leverage}배입니다.")
                 if self.leverage_input.text() and int(self.leverage_input.text()) > max_leverage:
                     self.leverage_input.setText(str(max_leverage))
+            # 새 Tick Size로 목표가를 다시 계산
+            self.calculate_and_display_target()
             return
         except Exception as e:
             logging.error(f"종목 정보 로드 실패: {e}", exc_info=True)
-            self.tick_size = Decimal('0')
-            self.step_size = Decimal('0')
+            self.symbol_info = {}
+            self.tick_size = _DEC_0
+            self.step_size = _DEC_0
+            self.price_precision = None
+            self.price_format = ",.2f"
+            self.order_book_format = "{:,.4f} ({:.3f})"
 
     def get_adjusted_max_notional(self, desired_notional, selected_leverage):
         if not self.leverage_brackets:
             return (desired_notional, selected_leverage)
-        for tier in self.leverage_brackets:
-            if desired_notional > Decimal(str(tier['notionalFloor'])) and desired_notional <= Decimal(
-                    str(tier['notionalCap'])):
-                allowed_leverage = Decimal(str(tier['initialLeverage']))
+        for notional_floor, notional_cap, allowed_leverage in self.leverage_brackets:
+            if notional_floor < desired_notional <= notional_cap:
                 if selected_leverage > allowed_leverage:
                     logging.warning(
                         f"레버리지 조정: 포지션 규모 ${desired_notional:,.0f} USDT는 최대 {allowed_leverage}배 레버리지만 허용됩니다.")
@@ -909,8 +1246,11 @@ class BinanceCalculatorApp(QWidget):
         return (desired_notional, selected_leverage)
 
     def update_asset_balance(self):
+        self.run_rest_async('account', self.client.futures_account, self._apply_asset_balance)
+
+    def _apply_asset_balance(self, future):
         try:
-            account_info = self.client.futures_account()
+            account_info = future.result()
             total_balance = Decimal(account_info['totalWalletBalance'])
             self.asset_group_box.setTitle(f"자산 현황 (총: ${total_balance:,.2f} USDT)")
             for asset in account_info['assets']:
@@ -925,15 +1265,17 @@ class BinanceCalculatorApp(QWidget):
     def place_order_logic(self, order_type):
         try:
             symbol = self.current_selected_symbol
+            if not self._check_symbol_info_ready(symbol):
+                return
             total_quantity_text = self.quantity_input.text()
-            total_quantity = Decimal(total_quantity_text) if total_quantity_text else Decimal('0')
+            total_quantity = Decimal(total_quantity_text) if total_quantity_text else _DEC_0
             grid_count_text = self.grid_count_input.text()
             grid_count = int(grid_count_text) if grid_count_text else 1
 
             if self.position_type is None:
                 QMessageBox.warning(self, "주문 오류", "포지션 타입을 먼저 선택해주세요.")
                 return
-            if total_quantity <= Decimal('0'):
+            if total_quantity <= _DEC_0:
                 QMessageBox.warning(self, "주문 오류", "총 주문 수량은 0보다 커야 합니다.")
                 return
             if grid_count < 1:
@@ -942,20 +1284,23 @@ class BinanceCalculatorApp(QWidget):
                 
             if order_type == 'entry':
                 title = "포지션 진입"
-                entry_price_text = self.entry_price_input.text()
-                if not entry_price_text:
+                # 📢 [수정] 입력 변경 시 캐시된 Decimal 값을 사용합니다. (format_entry_price에서 이미 조정됨)
+                if self._entry_dec is None:
                     QMessageBox.warning(self, "주문 오류", "기준 가격을 입력해주세요.")
                     return
-                # 진입가는 이미 format_entry_price에서 조정되었지만, Decimal로 다시 변환
-                center_price = Decimal(entry_price_text)
+                center_price = self._entry_dec
                 side = Client.SIDE_BUY if self.position_type == 'long' else Client.SIDE_SELL
             elif order_type == 'target':
                 title = "Target Price Limit"
-                if self.calculated_target_price_decimal is None:
+                # 📢 [추가] 대기 중인 재계산이 있으면 즉시 반영하여 최신 목표가로 주문합니다.
+                if self._calc_debounce.isActive():
+                    self._calc_debounce.stop()
+                    self._do_calc_and_display()
+                # 📢 [수정] 표시값은 float 미리보기이므로 주문 직전에 Decimal로 확정합니다.
+                center_price = self.finalize_target_price()
+                if center_price is None or center_price <= _DEC_0:
                     QMessageBox.warning(self, "주문 오류", "목표 가격을 먼저 계산해주세요.")
                     return
-                # 목표 가격은 calculate_and_display_target에서 이미 보수적으로 조정됨
-                center_price = self.calculated_target_price_decimal 
                 side = Client.SIDE_SELL if self.position_type == 'long' else Client.SIDE_BUY
             else:
                 return
@@ -970,58 +1315,63 @@ class BinanceCalculatorApp(QWidget):
             
             price_interval = Decimal(grid_interval_text) * self.tick_size
 
-            start_offset = -(Decimal(grid_count) - Decimal('1')) / Decimal('2')
-            for i in range(grid_count):
-                price_offset = (start_offset + Decimal(i)) * price_interval
-                price = center_price + price_offset
-
-                # 📢 [수정] 최종 가격을 API에 보내기 직전에 다시 한번! 확실하게 조정합니다.
-                if self.tick_size > Decimal('0'):
-                    if order_type == 'entry':
-                        if self.position_type == 'long':
-                            # Long 진입 (Buy)은 가격을 낮춰야 (ROUND_DOWN) 유리
-                            adjusted_price = price.quantize(self.tick_size, rounding=ROUND_DOWN)
-                        else:
-                            # Short 진입 (Sell)은 가격을 높여야 (ROUND_CEILING) 유리
-                            adjusted_price = price.quantize(self.tick_size, rounding=ROUND_CEILING)
-                    else:
-                        # 청산 주문(target): calculate_and_display_target에서 이미 보수적 조정됨
-                        # 여기서 다시 한번 보수적 로직을 적용 (redundancy를 통한 안전성 확보)
-                        if self.position_type == 'long':
-                            # 롱 청산 (SELL): 가격을 올림 (CEILING)
-                            adjusted_price = price.quantize(self.tick_size, rounding=ROUND_CEILING)
-                        else:
-                             # 숏 청산 (BUY): 가격을 내림 (FLOOR)
-                            adjusted_price = price.quantize(self.tick_size, rounding=ROUND_FLOOR)
-                else:
-                    adjusted_price = price
-                    
-                adjusted_quantity = self.adjust_quantity(quantity_per_order)
+            # 📢 [수정] 그리드 가격을 한 번에 생성합니다. (Decimal(i) 생성 없이 int 오프셋을 그대로 사용)
+            start_offset = -(Decimal(grid_count) - _DEC_1) / _DEC_2
+            base_price = center_price + start_offset * price_interval
+            grid_prices = [base_price + i * price_interval for i in range(grid_count)]
+
+            # 📢 [수정] 최종 가격을 API에 보내기 직전에 다시 한번! 확실하게 조정합니다.
+            # 반올림 방향은 모든 그리드 레벨에서 동일하므로 루프 밖에서 한 번만 결정합니다.
+            if self.tick_size > _DEC_0:
+                rounding_mode = {
+                    ('entry', 'long'): ROUND_DOWN,      # Long 진입 (Buy)은 가격을 낮춰야 유리
+                    ('entry', 'short'): ROUND_CEILING,  # Short 진입 (Sell)은 가격을 높여야 유리
+                    ('target', 'long'): ROUND_CEILING,  # 롱 청산 (SELL): 가격을 올림
+                    ('target', 'short'): ROUND_FLOOR,   # 숏 청산 (BUY): 가격을 내림
+                }[(order_type, self.position_type)]
+            else:
+                rounding_mode = None
+
+            # 📢 [수정] 분할 수량은 모든 레벨에서 동일하므로 한 번만 조정하고, 0이면 바로 중단합니다.
+            adjusted_quantity = self.adjust_quantity(quantity_per_order)
+            if adjusted_quantity <= _DEC_0:
+                QMessageBox.warning(self, "주문 오류", "분할 주문 수량이 최소 수량(Step Size)보다 작습니다. 수량을 늘리거나 분할 개수를 줄여주세요.")
+                return
+            # 지수 표기(예: 6E+4)가 API로 전달되지 않도록 고정 소수점 문자열로 변환
+            adjusted_quantity_str = f"{adjusted_quantity.normalize():f}"
 
-                orders_to_place.append({'price': str(adjusted_price.normalize()), 'quantity': str(adjusted_quantity.normalize())})
+            for price in grid_prices:
+                adjusted_price = price.quantize(self.tick_size, rounding=rounding_mode) if rounding_mode else price
+                orders_to_place.append({'price': f"{adjusted_price.normalize():f}", 'quantity': adjusted_quantity_str})
 
             logging.info(f"'{title}' 확인 없이 즉시 실행: {grid_count}개 분할, 총 수량 {total_quantity.normalize()}")
             success_count = 0
             failed_orders = []
-            for order in orders_to_place:
-                # 수량이 0이면 건너뜁니다.
-                if Decimal(order['quantity']) <= Decimal('0'):
-                    logging.debug(f"수량 0으로 주문 건너뜀: {order}")
-                    continue
-                    
+
+            # reduceOnly 옵션은 target 주문일 때만 사용 (청산 주문)
+            reduce_only = 'true' if order_type == 'target' else 'false'
+
+            # 📢 [수정] batchOrders API로 최대 5개씩 묶어 전송합니다. (주문당 HTTPS 왕복 → 5개당 1회)
+            for start in range(0, len(orders_to_place), 5):
+                chunk = orders_to_place[start:start + 5]
+                batch = [{'symbol': symbol, 'side': side, 'type': Client.ORDER_TYPE_LIMIT,
+                          'timeInForce': Client.TIME_IN_FORCE_GTC, 'quantity': o['quantity'],
+                          'price': o['price'], 'reduceOnly': reduce_only} for o in chunk]
+                logging.debug(f"🚀 Placing Batch Orders: SYMBOL={symbol}, SIDE={side}, ReduceOnly={reduce_only}, ORDERS={chunk}")
                 try:
-                    # reduceOnly 옵션은 target 주문일 때만 사용 (청산 주문)
-                    reduce_only = True if order_type == 'target' else False
-                    
-                    logging.debug(
-                        f"🚀 Placing Order: SYMBOL={symbol}, SIDE={side}, QTY={order['quantity']}, PRICE={order['price']}, ReduceOnly={reduce_only}")
-                    self.client.futures_create_order(symbol=symbol, side=side, type=Client.ORDER_TYPE_LIMIT,
-                                                     timeInForce=Client.TIME_IN_FORCE_GTC, quantity=order['quantity'],
-                                                     price=order['price'], reduceOnly=reduce_only)
-                    success_count += 1
+                    results = self.client.futures_place_batch_order(batchOrders=batch)
                 except Exception as e:
-                    failed_orders.append((order, e))
-                    logging.error(f"주문 실패 (가격: {order['price']}, 수량: {order['quantity']}): {e}", exc_info=True)
+                    failed_orders.extend((o, e) for o in chunk)
+                    logging.error(f"일괄 주문 실패 ({len(chunk)}건): {e}", exc_info=True)
+                    continue
+
+                # 응답은 주문 순서대로 반환되며, 실패한 항목은 {"code": ..., "msg": ...} 형태입니다.
+                for order, result in zip(chunk, results):
+                    if 'orderId' in result:
+                        success_count += 1
+                    else:
+                        failed_orders.append((order, result.get('msg', result)))
+                        logging.error(f"주문 실패 (가격: {order['price']}, 수량: {order['quantity']}): {result}")
 
             logging.info(f"주문 결과: {success_count}/{grid_count} 성공.")
             if failed_orders:
@@ -1037,9 +1387,17 @@ class BinanceCalculatorApp(QWidget):
             QMessageBox.critical(self, "오류", f"주문 처리 중 오류가 발생했습니다: {e}")
 
     def emergency_market_close(self):
+        if 'emergency_close' in self._inflight:
+            logging.info("비상 청산이 이미 진행 중입니다.")
+            return
+        # 📢 [수정] 전체 포지션 조회도 스레드 풀에서 실행하고, 확인 대화상자는 결과 도착 후 메인 스레드에서 띄웁니다.
+        self.run_rest_async('emergency_positions', self.client.futures_position_information,
+                            self._confirm_emergency_close)
+
+    def _confirm_emergency_close(self, future):
         try:
-            positions = self.client.futures_position_information()
-            open_positions = [p for p in positions if float(p['positionAmt']) != 0]
+            positions = future.result()
+            open_positions = [p for p in positions if _nonzero_amt(p['positionAmt'])]
             if not open_positions:
                 QMessageBox.information(self, "알림", "청산할 포지션이 없습니다.")
                 return
@@ -1058,28 +1416,62 @@ class BinanceCalculatorApp(QWidget):
 
             if reply == QMessageBox.Yes:
                 logging.warning("비상 시장가 청산 기능 실행!")
-                success_count = 0
+                tasks = []
                 for p in open_positions:
-                    symbol = p['symbol']
                     position_amt = float(p['positionAmt'])
                     side = Client.SIDE_SELL if position_amt > 0 else Client.SIDE_BUY
-                    quantity = abs(position_amt)
-                    try:
-                        # 청산만 요청하는 경우:
-                        self.client.futures_create_order(symbol=symbol, side=side, type=Client.ORDER_TYPE_MARKET,
-                                                         quantity=quantity, reduceOnly=True)
-                        success_count += 1
-                        logging.debug(f"{symbol} 포지션 시장가 청산 주문 제출 완료.")
-                    except Exception as e:
-                        logging.error(f"{symbol} 포지션 청산 중 오류 발생: {e}", exc_info=True)
-                        QMessageBox.critical(self, "청산 오류", f"{symbol} 포지션 청산 중 오류 발생:\n{e}")
-                QMessageBox.information(self, "실행 완료",
-                                        f"총 {len(open_positions)}개 중 {success_count}개 포지션에 대한 청산 주문을 제출했습니다.")
-                self.manual_refresh_data()
+                    tasks.append((p['symbol'], side, abs(position_amt)))
+                # 📢 [수정] 주문 제출과 결과 수집은 전용 스레드에서 실행하고, 결과만 메인 스레드에서 표시합니다.
+                # (공용 _pool은 주기 조회가 점유 중일 수 있으므로 사용하지 않음)
+                self._inflight.add('emergency_close')
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+                executor.submit(self._close_positions, tasks).add_done_callback(
+                    lambda f: self._invoker.invoke.emit(lambda: self._on_emergency_close_done(f)))
+                executor.shutdown(wait=False)
         except Exception as e:
             logging.error(f"비상 청산 기능 실행 중 오류: {e}", exc_info=True)
             QMessageBox.critical(self, "오류", f"비상 청산 기능 실행 중 오류가 발생했습니다: {e}")
 
+    def _close_positions(self, tasks):
+        """📢 [추가] 백그라운드 스레드에서 실행: 위젯은 건드리지 않고 (전체 수, 성공 수, 오류 목록)만 반환합니다."""
+        success_count = 0
+        errors = []
+        # 📢 [수정] 포지션별 시장가 청산 주문을 동시에 제출합니다. (총 소요 시간 N×RTT → 약 1×RTT)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+            futures = {}
+            for symbol, side, quantity in tasks:
+                # 청산만 요청하는 경우:
+                future = executor.submit(self.client.futures_create_order, symbol=symbol, side=side,
+                                         type=Client.ORDER_TYPE_MARKET, quantity=quantity, reduceOnly=True)
+                futures[future] = symbol
+
+            for future in concurrent.futures.as_completed(futures):
+                symbol = futures[future]
+                try:
+                    future.result()
+                    success_count += 1
+                    logging.debug(f"{symbol} 포지션 시장가 청산 주문 제출 완료.")
+                except Exception as e:
+                    logging.error(f"{symbol} 포지션 청산 중 오류 발생: {e}", exc_info=True)
+                    errors.append(f"{symbol}: {e}")
+        return len(tasks), success_count, errors
+
+    def _on_emergency_close_done(self, future):
+        self._inflight.discard('emergency_close')
+        try:
+            total, success_count, errors = future.result()
+        except Exception as e:
+            logging.error(f"비상 청산 기능 실행 중 오류: {e}", exc_info=True)
+            QMessageBox.critical(self, "오류", f"비상 청산 기능 실행 중 오류가 발생했습니다: {e}")
+            self.manual_refresh_data()
+            return
+        # 오류 대화상자는 모든 주문 제출이 끝난 뒤 한 번에 표시합니다.
+        if errors:
+            QMessageBox.critical(self, "청산 오류", "포지션 청산 중 오류 발생:\n" + "\n".join(errors))
+        QMessageBox.information(self, "실행 완료",
+                                f"총 {total}개 중 {success_count}개 포지션에 대한 청산 주문을 제출했습니다.")
+        self.manual_refresh_data()
+
     def place_entry_order(self):
         self.place_order_logic('entry')
 
@@ -1088,25 +1480,34 @@ class BinanceCalculatorApp(QWidget):
 
     def set_max_quantity(self):
         self.quantity_slider.setValue(100)
-        self.update_quantity_from_slider()
+        self._slider_debounce.stop()
+        if not self._check_symbol_info_ready(title="계산 오류"):
+            return
+        self._apply_slider_value()
 
     def update_quantity_from_slider(self):
+        """슬라이더 % 표시는 즉시 갱신하고, 수량 계산은 디바운스 후 한 번만 실행합니다."""
+        self.slider_label.setText(f"{self.quantity_slider.value()}%")
+        self._slider_debounce.start()
+
+    def _apply_slider_value(self):
+        if self.symbol_info.get('symbol') != self.current_selected_symbol:
+            return # 📢 [추가] 종목 정보 반영 전에는 이전 종목의 Step/구간으로 수량을 채우지 않습니다.
         try:
             percentage = self.quantity_slider.value()
-            self.slider_label.setText(f"{percentage}%")
-            if not self.leverage_input.text() or self.available_balance <= 0:
+            # 📢 [수정] 슬라이더 드래그 중에는 입력창을 다시 파싱하지 않고 캐시된 값을 사용합니다.
+            leverage = self._lev_dec
+            if leverage is None or self.available_balance <= 0:
                 return
-            leverage = Decimal(self.leverage_input.text())
             
             # 📢 [핵심 수정] Max 수량 계산 시 Entry Price Input을 우선적으로 사용
-            entry_price_text = self.entry_price_input.text()
-            if entry_price_text and Decimal(entry_price_text) > 0:
-                entry_price = Decimal(entry_price_text)
+            if self._entry_dec is not None and self._entry_dec > 0:
+                entry_price = self._entry_dec
             else:
                 # Entry Price가 0이거나 없을 경우에만 호가 사용
                 entry_price = self.best_ask_price if self.position_type == 'long' else self.best_bid_price
                 
-            if entry_price <= Decimal('0'):
+            if entry_price <= _DEC_0:
                 self.quantity_input.setText("0")
                 return
 
@@ -1116,9 +1517,9 @@ class BinanceCalculatorApp(QWidget):
             if int(leverage) != int(effective_leverage):
                 self.leverage_input.setText(str(int(effective_leverage)))
 
-            if entry_price > Decimal('0'):
+            if entry_price > _DEC_0:
                 max_quantity = adjusted_max_usdt_value / entry_price
-                target_quantity = max_quantity * (Decimal(percentage) / Decimal('100'))
+                target_quantity = max_quantity * (Decimal(percentage) / _DEC_100)
                 adjusted_quantity = self.adjust_quantity(target_quantity)
 
                 if adjusted_quantity > 0:
@@ -1135,20 +1536,23 @@ class BinanceCalculatorApp(QWidget):
     def on_symbol_changed(self, symbol: str):
         logging.info(f"거래 종목 변경: {symbol}")
         self.current_selected_symbol = symbol
+        self._last_target_key = None
         self.order_book_group_box.setTitle(f"{self.current_selected_symbol} 실시간 호가")
-        self.stop_worker()
-        self.start_worker()
+        self.latest_order_book_data = {}
+        # 📢 [수정] 연결이 살아 있으면 재연결 없이 SUBSCRIBE/UNSUBSCRIBE로 심볼만 전환합니다.
+        if self.worker and self.worker.running and self.worker.loop and self.worker.loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.worker.switch_symbols([symbol]), self.worker.loop)
+        else:
+            self.stop_worker()
+            self.start_worker()
         self.fetch_symbol_info()
         self.update_position_status()
         self.update_open_orders_status()
 
     def handle_connection_error(self, error_message):
-        """[수정] WebSocket 연결 오류 시 자동 재연결을 시도합니다."""
-        logging.error(f"WebSocket 연결 실패! {error_message} 5초 후 재연결 시도합니다.")
-        # 📢 [핵심 수정] QTimer를 이용해 5초 후 start_worker 재호출
-        if not self.reconnect_timer.isActive():
-            self.reconnect_timer.start(5000) 
-            QMessageBox.critical(self, "연결 오류", f"실시간 데이터 연결에 실패했습니다.\n{error_message}\n5초 후 자동 재연결을 시도합니다.")
+        """[수정] WebSocket 연결 오류를 알립니다. 재연결은 워커 내부에서 백오프로 자동 수행됩니다."""
+        logging.error(f"WebSocket 연결 실패! {error_message} 워커가 자동 재연결을 시도합니다.")
+        QMessageBox.critical(self, "연결 오류", f"실시간 데이터 연결에 실패했습니다.\n{error_message}\n자동으로 재연결을 시도합니다.")
 
     def on_order_book_price_clicked(self, label_text: str):
         try:
@@ -1188,26 +1592,60 @@ class BinanceCalculatorApp(QWidget):
         """Target Price Limit 버튼 활성화/비활성화 로직"""
         is_ready = (
             self.position_type is not None and
-            self.calculated_target_price_decimal is not None and
-            self.calculated_target_price_decimal > Decimal('0')
+            self._target_preview is not None and
+            self._target_preview > 0
         )
-        self.place_target_order_button.setEnabled(is_ready)
-
+        # 📢 [수정] 상태가 바뀔 때만 setEnabled 호출 (불필요한 repaint 방지)
+        if is_ready != self._target_button_ready:
+            self._target_button_ready = is_ready
+            self.place_target_order_button.setEnabled(is_ready)
+
+
+    @staticmethod
+    def _parse_input(text):
+        """숫자 입력만 Decimal로 변환합니다. ('', '.', 'nan' 등 유한한 숫자가 아닌 상태는 None)"""
+        if not text:
+            return None
+        # 📢 [수정] QDoubleValidator는 지수 표기(1e3)도 허용하므로 문자열 검사 대신 Decimal 변환 성공 여부로 판단합니다.
+        try:
+            value = _to_dec(text)
+        except InvalidOperation:
+            return None
+        return value if value.is_finite() else None
+
+    def _cache_inputs(self):
+        """📢 [추가] 입력값이 바뀔 때만 Decimal로 파싱해 두고, 계산에서는 캐시된 값을 사용합니다."""
+        self._entry_dec = self._parse_input(self.entry_price_input.text())
+        self._lev_dec = self._parse_input(self.leverage_input.text())
+        self._roi_dec = self._parse_input(self.roi_input.text())
+
+    def _load_config_values(self):
+        """📢 [추가] 수수료율을 config에서 한 번만 읽어 Decimal로 보관합니다. (config를 다시 읽는 경로를 추가하면 이 함수도 호출해야 함)"""
+        self._taker_fee_rate = Decimal(self.config.get('TRADING', 'taker_fee_rate'))
+        self._maker_fee_rate = Decimal(self.config.get('TRADING', 'maker_fee_rate'))
 
     def calculate_and_display_target(self):
+        """목표가 재계산 요청 (50ms 디바운스, 마지막 요청만 실행)"""
+        self._calc_debounce.start()
+
+    def _do_calc_and_display(self):
+        fee_rate = self._taker_fee_rate if self.taker_radio.isChecked() else self._maker_fee_rate
+        # 📢 [추가] 입력값이 마지막 계산과 같으면 (같은 버튼 재클릭 등) 다시 계산하지 않습니다.
+        target_key = (self._entry_dec, self._lev_dec, self._roi_dec, self.position_type, fee_rate)
+        if target_key == self._last_target_key:
+            return
+        self._last_target_key = None
+        self._target_args = None
+        self._target_preview = None
         try:
-            if not all([self.entry_price_input.text(), self.leverage_input.text(), self.roi_input.text()]):
+            if self._entry_dec is None or self._lev_dec is None or self._roi_dec is None:
                 self.calculated_target_price_decimal = None
                 self.update_target_button_state()
                 return
             
-            entry_price = Decimal(self.entry_price_input.text())
-            leverage = Decimal(self.leverage_input.text())
-            target_roi_percent = Decimal(self.roi_input.text())
-            if self.taker_radio.isChecked():
-                fee_rate = Decimal(self.config.get('TRADING', 'taker_fee_rate'))
-            else:
-                fee_rate = Decimal(self.config.get('TRADING', 'maker_fee_rate'))
+            entry_price = self._entry_dec
+            leverage = self._lev_dec
+            target_roi_percent = self._roi_dec
 
             if self.position_type is None:
                 self.target_price_label.setText("Target Price: N/A")
@@ -1215,31 +1653,28 @@ class BinanceCalculatorApp(QWidget):
                 self.calculated_target_price_decimal = None
                 self.update_target_button_state()
                 return
-            if entry_price <= Decimal('0') or leverage <= Decimal('0'):
+            if entry_price <= _DEC_0 or leverage <= _DEC_0:
                 self.target_price_label.setText("유효한 값을 입력하세요.")
                 self.price_change_label.setText("NLV: N/A")
                 self.calculated_target_price_decimal = None
                 self.update_target_button_state()
                 return
 
-            target_price = calculate_target_price(entry_price, leverage, target_roi_percent, self.position_type,
-                                                  fee_rate)
+            is_long = self.position_type == 'long'
+            # 📢 [수정] 키 입력마다 도는 미리보기는 float(JIT) 경로로 계산하고, Decimal 확정은 주문 시점에 수행합니다.
+            self.calculated_target_price_decimal = None
+            self._target_args = (entry_price, leverage, target_roi_percent, is_long, fee_rate)
+            target_price = _target_price_f(float(entry_price), float(leverage), float(target_roi_percent),
+                                           is_long, float(fee_rate))
 
             # --- [핵심 수정] 포지션에 따라 보수적으로 가격을 조정하는 로직 및 가격 표시 정밀도 변경 ---
-            if self.tick_size > Decimal('0'):
-                if self.position_type == 'long':
-                    # 롱 포지션(매도 목표)은 소수점을 올림(CEILING)하여 더 높은 가격으로 설정
-                    rounding_mode = ROUND_CEILING
-                else:  # short
-                    # 숏 포지션(매수 목표)은 소수점을 내림(FLOOR)하여 더 낮은 가격으로 설정
-                    rounding_mode = ROUND_FLOOR
-
-                # 가격을 틱 사이즈에 맞게 양자화 (조정)
-                adjusted_target_price = target_price.quantize(self.tick_size, rounding=rounding_mode)
-                
-                # 👇 [수정된 부분] tick_size를 이용하여 포맷팅 정밀도(precision)를 계산
+            if self.tick_size > _DEC_0:
+                tick = float(self.tick_size)
+                # 롱 포지션(매도 목표)은 올림(CEILING), 숏 포지션(매수 목표)은 내림(FLOOR) (부동소수 오차 허용)
+                ticks = math.ceil(target_price / tick - 1e-9) if is_long else math.floor(target_price / tick + 1e-9)
+                adjusted_target_price = ticks * tick
                 # 예: tick_size='0.01' -> precision=2, tick_size='1.0' -> precision=0
-                precision = max(0, -self.tick_size.as_tuple().exponent) 
+                precision = self.price_precision
             else:
                 # tick_size 정보가 없는 경우 (예외 상황), 계산된 가격을 그대로 사용
                 adjusted_target_price = target_price
@@ -1247,15 +1682,10 @@ class BinanceCalculatorApp(QWidget):
                 
             # -----------------------------------------------------------
 
-            self.calculated_target_price_decimal = adjusted_target_price
-            
-            # 👇 [수정된 부분] 계산된 정밀도(precision)와 Decimal.normalize()를 사용하여 포맷팅합니다.
-            price_format_string = f"{{:,.{precision}f}}"
-            
-            # 최종 표시 문자열 생성
-            self.target_price_label.setText(f"Target Price: ${price_format_string.format(adjusted_target_price)}")
+            self._target_preview = adjusted_target_price
+            self.target_price_label.setText(f"Target Price: ${adjusted_target_price:,.{precision}f}")
 
-            required_change_percent = (target_roi_percent / leverage) + (fee_rate * Decimal('100'))
+            required_change_percent = (target_roi_percent / leverage) + (fee_rate * _DEC_100)
             if self.position_type == 'long':
                 color = "red"
                 sign = "+"
@@ -1265,6 +1695,7 @@ class BinanceCalculatorApp(QWidget):
             html_text = (f"NLV: <b style='color:{color};'>{sign}{required_change_percent:.2f}%</b>")
             self.price_change_label.setText(html_text)
             
+            self._last_target_key = target_key
             # 📢 [추가] 계산 성공 후 버튼 상태 업데이트
             self.update_target_button_state()
 
@@ -1275,6 +1706,22 @@ class BinanceCalculatorApp(QWidget):
             self.calculated_target_price_decimal = None
             self.update_target_button_state()
 
+    def finalize_target_price(self):
+        """📢 [추가] 마지막 입력값으로 목표가를 Decimal로 계산하고 Tick Size에 맞춰 확정합니다. (주문 전용)"""
+        if self._target_args is None:
+            return None
+        target_price = calculate_target_price(*self._target_args)
+        if self.tick_size > _DEC_0:
+            rounding_mode = ROUND_CEILING if self._target_args[3] else ROUND_FLOOR
+            target_price = align_to_step(target_price, self.tick_size, rounding_mode)
+            precision = self.price_precision
+        else:
+            precision = self.symbol_info.get('pricePrecision', 2)
+        self.calculated_target_price_decimal = target_price
+        # 표시값을 실제 주문 가격과 일치시킵니다.
+        self.target_price_label.setText(f"Target Price: ${target_price:,.{precision}f}")
+        return target_price
+
 
 if __name__ == "__main__":
     setup_logging()
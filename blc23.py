@@ -3,15 +3,20 @@ import asyncio
 import websockets
 import json
 import math
+import time
 import os
 import configparser
 import logging
 import pyotp
 import smtplib
 import random
+import bisect
+import threading
+import functools
+import concurrent.futures
 from email.message import EmailMessage
 from logging.handlers import RotatingFileHandler
-from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP, ROUND_CEILING, ROUND_FLOOR
+from decimal import Decimal, InvalidOperation, ROUND_DOWN, ROUND_HALF_UP, ROUND_CEILING, ROUND_FLOOR
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
@@ -19,21 +24,41 @@ from PyQt5.QtWidgets import (
     QRadioButton, QSlider, QGridLayout, QSplashScreen, 
     QDesktopWidget, QShortcut, QDialog
 )
-from PyQt5.QtGui import QFont, QDoubleValidator, QCursor, QPixmap, QKeySequence, QIcon
+from PyQt5.QtGui import QFont, QDoubleValidator, QCursor, QPixmap, QImage, QKeySequence, QIcon
 from PyQt5.QtCore import (
-    Qt, QObject, pyqtSignal, QThread, QTimer, QCoreApplication,
+    Qt, QObject, pyqtSignal, pyqtSlot, QThread, QTimer, QCoreApplication,
     QPropertyAnimation, QEasingCurve, QUrl, QSize
 )
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
 
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
+from requests.adapters import HTTPAdapter
 
 # --- 유틸리티 파일 임포트 ---
 # 이 파일들이 없으면 프로그램이 시작되지 않는 것이 정상입니다.
 from password_util import verify_password
 from crypto_util import decrypt_data
 
+# ✨ numba가 설치되어 있으면 목표가 미리보기 계산을 JIT 컴파일 (미설치 시 일반 파이썬 함수)
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# ✨ uvloop가 설치되어 있으면 WebSocket 루프에 사용 (Windows 등 미지원 환경은 기본 asyncio 루프)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# ✨ 호가 메시지 디코딩은 orjson 사용 (미설치 시 표준 json)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 BASE_DIR = os.path.dirname(os.path.abspath(sys.argv[0]))
 
 # --- QObject를 상속받아 시그널을 방출하는 핸들러 ---
@@ -148,17 +173,36 @@ class SplashManager(QObject):
         self.is_ready = False
         self.pixmap = None
         self.animation = None
+        self._show_requested = False
+        self._hidden = False # 로드 완료 전에 hide_splash가 호출되었으면 나중에 표시하지 않음
+        # ✨ 이미지 디코딩은 백그라운드 스레드에서 수행 (QImage는 GUI 스레드 밖에서 사용 가능, QPixmap 변환만 메인 스레드)
+        self._invoker = MainThreadInvoker()
+        threading.Thread(target=self._load_image, daemon=True).start()
+
+    def _load_image(self):
         try:
-            self.pixmap = QPixmap(self.full_image_path)
-            if self.pixmap.isNull():
-                logging.error(f"스플래시 이미지 로드 실패: 절대 경로({self.full_image_path})를 확인하세요.")
-            else:
-                self.is_ready = True
+            image = QImage(self.full_image_path)
+            if not image.isNull():
+                image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
         except Exception as e:
             logging.error(f"스플래시 초기화 중 오류: {e}")
+            return
+        self._invoker.invoke.emit(lambda: self._on_image_loaded(image))
+
+    def _on_image_loaded(self, image):
+        if image.isNull():
+            logging.error(f"스플래시 이미지 로드 실패: 절대 경로({self.full_image_path})를 확인하세요.")
+            return
+        self.pixmap = QPixmap.fromImage(image)
+        self.is_ready = True
+        if self._show_requested and not self._hidden:
+            self.show_splash()
 
     def show_splash(self):
-        if not self.is_ready: return
+        self._hidden = False
+        if not self.is_ready:
+            self._show_requested = True # 이미지 로드가 끝나면 바로 표시
+            return
         self.splash = QSplashScreen(self.pixmap)
         screen_geometry = QApplication.desktop().screenGeometry()
         x = (screen_geometry.width() - self.pixmap.width()) // 2
@@ -174,6 +218,9 @@ class SplashManager(QObject):
         self.animation.start()
         
     def hide_splash(self, main_window=None, duration_ms=0):
+        # 이미지 로드 전에 숨김 요청이 오면 대기 중인 표시 요청도 취소
+        self._show_requested = False
+        self._hidden = True
         if not self.is_ready or not self.splash: return
         if self.animation and self.animation.state() == QPropertyAnimation.Running: self.animation.stop()
         if duration_ms > 0:
@@ -320,6 +367,10 @@ class LoginDialog(QDialog):
                 
                 # Binance 클라이언트 연결 테스트
                 client = Client(api_key, secret_key)
+                # ✨ 스레드 풀/비상 청산의 동시 REST 호출이 TLS 연결을 재사용하도록 커넥션 풀을 늘림
+                adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+                client.session.mount('https://', adapter)
+                client.session.headers['Connection'] = 'keep-alive'
                 client.futures_ping()
                 self.client = client
                 
@@ -346,72 +397,183 @@ class LoginDialog(QDialog):
             self.message_label.setText("인증번호가 올바르지 않습니다.")
 
 
+# --- ✨ 커스텀 입력창 클래스: 입력이 바뀔 때 한 번만 Decimal로 파싱해 value에 보관 ---
+class NumericLineEdit(QLineEdit):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.value = None # 숫자가 아니거나 비어 있으면 None
+        self.textChanged.connect(self._on_text_changed)
+
+    def _on_text_changed(self, text):
+        try:
+            value = Decimal(text)
+            self.value = value if value.is_finite() else None
+        except InvalidOperation:
+            self.value = None
+
+
 # --- 커스텀 라벨 클래스 ---
 class ClickablePriceLabel(QLabel):
     clicked = pyqtSignal(str)
+    # ✨ 10개 호가 라벨이 공유하는 스타일 템플릿 (인스턴스마다 f-string을 새로 만들지 않음)
+    _STYLE_TEMPLATE = """
+            QLabel {
+                background-color: #FFFFFF; color: %s; border: 1px solid #DCDCDC;
+                border-radius: 4px; padding: 6px;
+            }
+            QLabel:hover { background-color: #F0F0F0; }
+        """
     def __init__(self, text, color, parent=None):
         super().__init__(text, parent)
         self.color = color
         self.setAlignment(Qt.AlignCenter)
         self.setFont(QFont("Arial", 11, QFont.Bold))
         self.setCursor(QCursor(Qt.PointingHandCursor))
-        self.setStyleSheet(f"""
-            QLabel {{
-                background-color: #FFFFFF; color: {self.color}; border: 1px solid #DCDCDC;
-                border-radius: 4px; padding: 6px;
-            }}
-            QLabel:hover {{ background-color: #F0F0F0; }}
-        """)
+        self.setStyleSheet(self._STYLE_TEMPLATE % color)
     def mousePressEvent(self, event):
         self.clicked.emit(self.text())
 
 
+# ✨ 다른 스레드에서 invoke.emit(fn)하면 fn이 메인(GUI) 스레드에서 실행됩니다.
+class MainThreadInvoker(QObject):
+    invoke = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.invoke.connect(self._run)
+
+    @pyqtSlot(object)
+    def _run(self, fn):
+        fn()
+
+
 # --- WebSocket 워커 ---
 class BinanceWorker(QObject):
-    data_received = pyqtSignal(dict)
+    data_received = pyqtSignal(str, dict) # (심볼, 호가 데이터)
     connection_error = pyqtSignal(str)
-    def __init__(self, symbol, websocket_uri):
+    def __init__(self, symbols, active_symbol, websocket_uri):
         super().__init__()
-        self.symbol = symbol.lower()
+        # ✨ Combined Stream 하나로 모든 거래 종목을 구독하고, 선택된 종목의 프레임만 UI로 전달
+        #    (종목 변경 시 연결을 끊지 않고 active_symbol만 바꿈)
+        self.symbols = [s.lower() for s in symbols]
+        self.symbol = '/'.join(self.symbols) # 로그 표시용
+        self.active_symbol = active_symbol.lower()
         self.running = False
-        self.websocket_uri = f"{websocket_uri}/{self.symbol}@depth5@100ms"
+        stream_base_uri = websocket_uri.rsplit('/', 1)[0] + '/stream' # .../ws -> .../stream
+        self.websocket_uri = f"{stream_base_uri}?streams=" + '/'.join(f"{s}@depth5@100ms" for s in self.symbols)
     def run(self):
         self.running = True
-        asyncio.run(self.connect_and_listen())
+        if uvloop:
+            uvloop.run(self.connect_and_listen())
+        else:
+            asyncio.run(self.connect_and_listen())
     async def connect_and_listen(self):
-        try:
-            async with websockets.connect(self.websocket_uri) as websocket:
-                logging.info(f"{self.symbol} WebSocket에 연결되었습니다.")
-                while self.running:
-                    try:
-                        message = await asyncio.wait_for(websocket.recv(), timeout=0.2)
-                        self.data_received.emit(json.loads(message))
-                    except asyncio.TimeoutError:
-                        continue
-                    except websockets.exceptions.ConnectionClosed:
-                        logging.warning(f"{self.symbol} WebSocket 연결 문제 발생, 재연결 시도...")
+        # ✨ 연결이 끊기면 스레드를 종료하지 않고 같은 websocket_uri로 지수 백오프(1~30초) 재연결
+        #    (종목 변경은 active_symbol만 바꾸므로 재연결은 이 루프가 책임짐)
+        backoff = 1
+        while self.running:
+            try:
+                # ✨ depth5 메시지는 2KB 미만의 JSON이므로 압축(permessage-deflate)을 끄고 최대 메시지 크기를 줄임
+                async with websockets.connect(self.websocket_uri, compression=None, max_size=2**16) as websocket:
+                    backoff = 1
+                    logging.info(f"{self.symbol} WebSocket에 연결되었습니다.")
+                    while self.running:
+                        try:
+                            message = await asyncio.wait_for(websocket.recv(), timeout=0.2)
+                            # ✨ 프레임은 {"stream":"btcusdt@depth5@100ms","data":{...}} 형태 → 선택되지 않은 종목은
+                            #    전체 JSON을 디코딩하기 전에 앞부분의 스트림 이름만 보고 버림
+                            active_symbol = self.active_symbol
+                            if '"stream":"%s@' % active_symbol not in message[:64]:
+                                continue
+                            frame = json_loads(message)
+                            self.data_received.emit(active_symbol.upper(), frame['data'])
+                        except asyncio.TimeoutError:
+                            continue
+                        except websockets.exceptions.ConnectionClosed:
+                            logging.warning(f"{self.symbol} WebSocket 연결 문제 발생, 재연결 시도...")
+                            break
+            except Exception as e:
+                logging.error(f"WebSocket 연결 실패: {e}", exc_info=True)
+                # 연속 실패 중에는 첫 실패만 UI에 알림
+                if self.running and backoff == 1:
+                    self.connection_error.emit(f"WebSocket 연결 실패: {e}")
+            if self.running:
+                logging.info(f"{self.symbol} WebSocket {backoff}초 후 재연결 시도...")
+                # stop()이 바로 반영되도록 짧게 나눠서 대기
+                for _ in range(backoff * 5):
+                    if not self.running:
                         break
-        except Exception as e:
-            self.connection_error.emit(f"WebSocket 연결 실패: {e}")
-            logging.error(f"WebSocket 연결 실패: {e}", exc_info=True)
+                    await asyncio.sleep(0.2)
+                backoff = min(backoff * 2, 30)
     def stop(self):
         self.running = False
 
 
 # --- 핵심 계산 로직 ---
+REST_CACHE_TTL = 1.0 # ✨ 포지션/미체결 주문 조회 결과 재사용 시간(초)
+EXCHANGE_INFO_TTL = 600 # ✨ 거래소 정보(exchangeInfo) 캐시 유지 시간(초)
+
+# ✨ 자주 쓰는 Decimal 상수는 한 번만 생성
+_D1 = Decimal('1')
+_D100 = Decimal('100')
+_POSITION_SIGN = {'long': 1, 'LONG': 1, 'short': -1, 'SHORT': -1} # ✨ .lower() 없이 대소문자 모두 조회
+_POSITION_SIGN_DEC = {k: Decimal(v) for k, v in _POSITION_SIGN.items()}
+
+def _nonzero_amt(s: str) -> bool:
+    """✨ positionAmt 문자열('0', '0.000', '-1.23' 등)이 0이 아닌지 숫자 변환 없이 확인합니다."""
+    return any(ch != '0' and ch.isdigit() for ch in s)
+
+
+def _step_to_int(step: Decimal):
+    """✨ step(예: 0.01, 0.5)을 (소수 자릿수, 정수 step) 쌍으로 변환 (종목 정보 로드 시 한 번만 계산)"""
+    step = step.normalize()
+    exp = max(0, -step.as_tuple().exponent)
+    return exp, int(step.scaleb(exp))
+
+
+def _round_down_to_step(value: Decimal, exp: int, step_int: int) -> Decimal:
+    """✨ 정수 연산으로 value를 step의 배수로 내림(0 방향) 정렬합니다. (0.5, 0.25 같은 step도 정확히 정렬)"""
+    scaled = int(value.scaleb(exp)) # 소수 자릿수 밖은 0 방향으로 절사
+    remainder = abs(scaled) % step_int
+    scaled = scaled - remainder if scaled >= 0 else scaled + remainder
+    return Decimal(scaled).scaleb(-exp)
+
+
+@functools.lru_cache(maxsize=256)
 def calculate_target_price(
-        entry_price: Decimal, leverage: Decimal, target_roi_percent: Decimal, position_type: str, fee_rate: Decimal
+        entry_price: Decimal, leverage: Decimal, target_roi_percent: Decimal, position_type: str,
+        open_fee: Decimal, close_fee: Decimal
 ) -> Decimal:
-    target_roi = target_roi_percent / Decimal('100.0')
-    if position_type.lower() == 'long':
-        return entry_price * (Decimal('1') + (target_roi / leverage) + fee_rate) / (Decimal('1') - fee_rate)
-    elif position_type.lower() == 'short':
-        return entry_price * (Decimal('1') - (target_roi / leverage) - fee_rate) / (Decimal('1') + fee_rate)
-    raise ValueError("Position type must be 'long' or 'short'")
+    """주문용 Decimal 목표가 (포지션 nTP → 목표가 지정가 주문의 기준 가격)"""
+    sign = _POSITION_SIGN_DEC.get(position_type)
+    if sign is None:
+        raise ValueError("Position type must be 'long' or 'short'")
+    target_roi = target_roi_percent / _D100
+    # 롱: (1 + ROI/레버리지 + 진입 수수료) / (1 - 청산 수수료), 숏: 부호만 반대
+    return entry_price * (_D1 + sign * (target_roi / leverage) + sign * open_fee) / (_D1 - sign * close_fee)
+
+
+# ✨ 화면 표시 전용 float 목표가 (Decimal은 numba 미지원이라 분리, 시그니처 지정으로 import 시 컴파일)
+#    진입 수수료(open_fee)와 청산 수수료(close_fee)를 따로 받아 T/M 모드도 같은 식으로 계산
+@njit('f8(f8,f8,f8,f8,f8,f8)', cache=True, fastmath=True)
+def _target_price_f64(entry, leverage, roi_pct, sign, open_fee, close_fee):
+    r = roi_pct * 0.01
+    return entry * (1.0 + sign * (r / leverage) + sign * open_fee) / (1.0 - sign * close_fee)
 
 
 # --- GUI 애플리케이션 클래스 ---
 class BinanceCalculatorApp(QWidget):
+    # ✨ 포지션 한 줄 HTML 템플릿 (매 갱신마다 f-string을 다시 조립하지 않고 %-포맷으로 채움)
+    _POS_TEMPLATE = ("<b style='font-size:11pt;'>%(symbol)s <span style='color:%(position_color)s;'>(%(position_side)s)</span></b><br>"
+                     " - <b>수익(nPNL):</b> <span style='color:%(net_color)s;'><b>$%(net_pnl)s</b></span><br>"
+                     " - <b>수익률(nROE):</b> <span style='color:%(net_color)s;'><b>%(net_roe)s</b></span><br>"
+                     " - <b>목표가(nTP):</b> <span style='color:green;'><b>%(ntp)s</b></span><br>"
+                     " - <b>진입가:</b> $%(entry_price)s<br>"
+                     " - <b>시장가:</b> $%(mark_price)s<br>"
+                     " - <b>청산가:</b> <span style='color:orange;'>$%(liq_price)s</span><br>"
+                     " - <b>수량:</b> %(quantity)s<br>"
+                     "--------------------------<br>")
+
     def __init__(self, client, qt_log_handler): 
         super().__init__()
 
@@ -441,6 +603,7 @@ class BinanceCalculatorApp(QWidget):
         #    QCoreApplication.quit()
             
         self.current_selected_symbol = self.config.get('TRADING', 'default_symbol')
+        self._load_config_values()
         self.position_type = None
         self.worker_thread = None
         self.worker = None
@@ -448,13 +611,32 @@ class BinanceCalculatorApp(QWidget):
         self.best_ask_price = Decimal('0')
         self.best_bid_price = Decimal('0')
         self.symbol_info = {}
+        self._symbol_info_symbol = None # ✨ Tick/Step/레버리지 구간이 반영된 종목 (다른 종목이면 주문 차단)
+        self._exchange_info_by_symbol = {} # ✨ 심볼 -> exchangeInfo 항목 (종목 변경 시 재조회 방지)
+        self._exchange_info_time = 0.0
+        self._filters_by_symbol = {} # ✨ 심볼 -> {filterType: filter}
         self.tick_size = Decimal('0')
         self.step_size = Decimal('0')
+        self._tick_exp, self._tick_int = 0, 1 # ✨ 정수 Tick/Step 연산용 (fetch_symbol_info에서 갱신)
+        self._step_exp, self._step_int = 0, 1
+        self._ob_precision = 4
+        self._price_format = ",.2f" # 미체결 주문/포지션 가격 표시용
+        self._ob_format_string = "{:,.4f} ({:.3f})" # ✨ 호가 표시 포맷 (Tick Size가 바뀔 때만 다시 만듦)
         self.latest_order_book_data = {}
+        # ✨ 호가가 바뀐 경우에만 UI를 갱신하기 위한 상태
+        self._ob_dirty = False
+        self._ob_top = None
+        self._last_asks = [None] * 5 # ✨ 호가 줄별 마지막으로 그린 (가격, 수량) 문자열
+        self._last_bids = [None] * 5
         self.leverage_brackets = []
+        # ✨ 레버리지 구간을 미리 Decimal 배열로 변환 (get_adjusted_max_notional에서 이진 탐색)
+        self._tier_floors = []
+        self._tier_caps = []
+        self._tier_lev = []
         self.is_retry_scheduled = False
         self.calculated_target_price_decimal = None  
         self.calculated_ntp_decimal = None
+        self.calculated_ntp_symbol = None # ✨ nTP를 계산한 종목 (다른 종목의 nTP로 주문하지 않도록 함께 보관)
         
         try:
              self.shortcuts = load_shortcuts(filename=os.path.join(BASE_DIR, 'shortcuts.json'))
@@ -462,6 +644,27 @@ class BinanceCalculatorApp(QWidget):
              logging.error(f"shortcuts.json 파일 로드 실패: {e}")
              self.shortcuts = {} 
 
+        # ✨ REST 호출은 스레드 풀에서 실행하고, UI 반영만 메인 스레드에서 수행
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        self._invoker = MainThreadInvoker()
+        self._inflight = set()
+        self._rest_fetched_at = {} # (종류, 심볼) -> 마지막 조회 시각
+        self._last_orders_render = None # 마지막으로 그린 미체결 주문 입력값
+        self._last_positions_render = None # 마지막으로 그린 포지션 입력값
+        self._last_display_text = {} # 위젯별 마지막 표시 문자열
+
+        # ✨ 입력이 연속으로 바뀔 때는 50ms 동안 멈춘 뒤 마지막 값으로 한 번만 목표가를 계산
+        self._calc_timer = QTimer(self)
+        self._calc_timer.setSingleShot(True)
+        self._calc_timer.setInterval(50)
+        self._calc_timer.timeout.connect(self._do_calculate)
+
+        # ✨ 슬라이더 드래그 중에는 라벨만 갱신하고, 30ms 동안 멈추면 마지막 값으로 수량을 한 번만 계산
+        self._slider_timer = QTimer(self)
+        self._slider_timer.setSingleShot(True)
+        self._slider_timer.setInterval(30)
+        self._slider_timer.timeout.connect(self._do_quantity_update)
+
         self.initUI()
         self.start_worker()
         self.update_asset_balance()
@@ -471,8 +674,7 @@ class BinanceCalculatorApp(QWidget):
         self.qt_log_handler.log_record.connect(self.update_log_display)
 
         self.position_timer = QTimer(self)
-        self.position_timer.timeout.connect(self.update_position_status)
-        self.position_timer.timeout.connect(self.update_open_orders_status)
+        self.position_timer.timeout.connect(self.refresh_account_status)
         self.position_timer.start(self.config.getint('APP_SETTINGS', 'position_update_interval_ms'))
 
         self.ui_update_timer = QTimer(self)
@@ -488,14 +690,16 @@ class BinanceCalculatorApp(QWidget):
             percentage = 100  # SuperMax는 무조건 100%
             self.slider_label.setText(f"{percentage}%")
             self.quantity_slider.setValue(percentage) # 슬라이더도 100으로 동기화
+            self._slider_timer.stop() # ✨ 수량은 아래에서 직접 계산하므로 슬라이더 재계산 취소
+            if not self._check_symbol_info_ready(title="계산 오류"): return
 
-            if not self.leverage_input.text() or self.available_balance <= 0: return
+            if self.leverage_input.value is None or self.available_balance <= 0: return
 
-            leverage = Decimal(self.leverage_input.text())
+            leverage = self.leverage_input.value
             entry_price = self.best_ask_price if self.position_type != 'short' else self.best_bid_price
             if entry_price <= Decimal('0'):
-                if self.entry_price_input.text() and Decimal(self.entry_price_input.text()) > 0:
-                    entry_price = Decimal(self.entry_price_input.text())
+                if self.entry_price_input.value is not None and self.entry_price_input.value > 0:
+                    entry_price = self.entry_price_input.value
                 else:
                     return
 
@@ -569,16 +773,18 @@ class BinanceCalculatorApp(QWidget):
             self.daily_pnl_amount_label.setText("xPNL: -")
 
     def update_slider_from_quantity(self):
+        if self._symbol_info_symbol != self.current_selected_symbol:
+            return # 종목 정보 반영 전에는 레버리지 구간을 알 수 없음
         # 무한 루프 방지를 위해 슬라이더의 신호를 일시적으로 끊음
         self.quantity_slider.blockSignals(True)
         
         try:
             # 최대 구매 가능 수량 계산 (기존 로직 재사용)
-            leverage = Decimal(self.leverage_input.text())
+            leverage = self.leverage_input.value
             entry_price = self.best_ask_price if self.position_type != 'short' else self.best_bid_price
             if entry_price <= Decimal('0'):
-                if self.entry_price_input.text() and Decimal(self.entry_price_input.text()) > 0:
-                    entry_price = Decimal(self.entry_price_input.text())
+                if self.entry_price_input.value is not None and self.entry_price_input.value > 0:
+                    entry_price = self.entry_price_input.value
                 else:
                     self.quantity_slider.blockSignals(False)
                     return
@@ -629,9 +835,19 @@ class BinanceCalculatorApp(QWidget):
 
     def place_limit_close_order(self):
         symbol = self.current_selected_symbol
+        if not self._check_symbol_info_ready(symbol, "청산 오류"):
+            return
+        self.run_rest_async(('limit_close', symbol),
+                            lambda: self.client.futures_position_information(symbol=symbol),
+                            lambda f: self._submit_limit_close_order(symbol, f))
+
+    def _submit_limit_close_order(self, symbol, future):
+        # 포지션 조회 중에 종목이 바뀌었으면 Tick/Step이 다른 종목 기준이므로 주문하지 않음
+        if not self._check_symbol_info_ready(symbol, "청산 오류"):
+            return
         try:
-            positions = self.client.futures_position_information(symbol=symbol)
-            open_position = next((p for p in positions if Decimal(p['positionAmt']) != Decimal('0')), None)
+            positions = future.result()
+            open_position = next((p for p in positions if _nonzero_amt(p['positionAmt'])), None)
 
             if not open_position:
                 QMessageBox.warning(self, "청산 오류", "현재 청산할 포지션이 없습니다.")
@@ -641,7 +857,8 @@ class BinanceCalculatorApp(QWidget):
             position_side = "LONG" if position_amt > Decimal('0') else "SHORT"
             side = Client.SIDE_SELL if position_side == "LONG" else Client.SIDE_BUY
             limit_price_text = self.limit_price_input.text()
-            quantity_text = self.limit_quantity_input.text().strip().upper()
+            # 입력창의 QDoubleValidator가 문자/공백 입력을 막으므로 'MAX'는 setText로 넣은 대문자 그대로만 존재
+            quantity_text = self.limit_quantity_input.text()
 
             if not limit_price_text:
                 QMessageBox.warning(self, "주문 오류", "청산 지정가를 입력해주세요.")
@@ -669,16 +886,28 @@ class BinanceCalculatorApp(QWidget):
                                     f"청산하려는 수량({adjusted_quantity.normalize()})이 현재 포지션 수량({position_amt.copy_abs().normalize()})보다 많습니다.")
                 return
 
-            order = self.client.futures_create_order(
-                symbol=symbol,
-                side=side,
-                type=Client.ORDER_TYPE_LIMIT,
-                timeInForce=Client.TIME_IN_FORCE_GTC,
-                quantity=adjusted_quantity.normalize(),
-                price=str(adjusted_price.normalize()),
-                reduceOnly=True
-            )
+            self.run_rest_async(('limit_close_order', symbol),
+                                lambda: self.client.futures_create_order(
+                                    symbol=symbol,
+                                    side=side,
+                                    type=Client.ORDER_TYPE_LIMIT,
+                                    timeInForce=Client.TIME_IN_FORCE_GTC,
+                                    quantity=adjusted_quantity.normalize(),
+                                    price=str(adjusted_price.normalize()),
+                                    reduceOnly=True
+                                ),
+                                lambda f: self._on_limit_close_done(symbol, position_side, side, adjusted_quantity, f))
 
+        except BinanceAPIException as e:
+            logging.error(f"LIMIT 청산 주문 실패: {e}", exc_info=True)
+            QMessageBox.critical(self, "주문 실패", f"LIMIT 청산 주문 실패: {e.message}")
+        except Exception as e:
+            logging.error(f"LIMIT 청산 주문 중 일반 오류 발생: {e}", exc_info=True)
+            QMessageBox.critical(self, "오류", f"LIMIT 청산 주문 중 오류 발생: {e}")
+
+    def _on_limit_close_done(self, symbol, position_side, side, adjusted_quantity, future):
+        try:
+            order = future.result()
             logging.info(f"LIMIT 청산 주문 제출 성공 (SIDE: {side}, 수량: {adjusted_quantity}): {order}")
             QMessageBox.information(
                 self,
@@ -697,8 +926,13 @@ class BinanceCalculatorApp(QWidget):
 
     def cancel_all_open_orders(self):
         symbol = self.current_selected_symbol
+        self.run_rest_async(('cancel_all', symbol),
+                            lambda: self.client.futures_cancel_all_open_orders(symbol=symbol),
+                            lambda f: self._on_cancel_all_done(symbol, f))
+
+    def _on_cancel_all_done(self, symbol, future):
         try:
-            result = self.client.futures_cancel_all_open_orders(symbol=symbol)
+            result = future.result()
 
             if result.get('code') == 200:
                 QMessageBox.information(self, "성공", f"{symbol}의 모든 미체결 주문이 성공적으로 취소되었습니다.")
@@ -851,7 +1085,7 @@ class BinanceCalculatorApp(QWidget):
         # 기준 가격 (Entry Price)
         entry_price_layout = QHBoxLayout()
         entry_price_label = QLabel("기준 가격:")
-        self.entry_price_input = QLineEdit(self)
+        self.entry_price_input = NumericLineEdit(self)
         self.entry_price_input.setValidator(QDoubleValidator(0.0, 1e9, 8))
         self.entry_price_input.setText("0.00")
         self.entry_price_input.textChanged.connect(self.calculate_and_display_target)
@@ -864,7 +1098,7 @@ class BinanceCalculatorApp(QWidget):
         leverage_layout = QHBoxLayout()
         self.leverage_label = QLabel("레버리지 (x):")
         self.leverage_label.setToolTip("종목 변경 시 최대 레버리지가 자동으로 설정됩니다.")
-        self.leverage_input = QLineEdit(self)
+        self.leverage_input = NumericLineEdit(self)
         self.leverage_input.setValidator(QDoubleValidator(1.0, 125.0, 0))
         self.leverage_input.setText("10")
         self.leverage_input.textChanged.connect(self.calculate_and_display_target)
@@ -875,7 +1109,7 @@ class BinanceCalculatorApp(QWidget):
         # 목표 수익률 (ROI)
         roi_layout = QHBoxLayout()
         roi_label = QLabel("목표 수익률 (%):")
-        self.roi_input = QLineEdit(self)
+        self.roi_input = NumericLineEdit(self)
         self.roi_input.setValidator(QDoubleValidator(0.01, 1e6, 2))
         self.roi_input.setText("10")
         self.roi_input.textChanged.connect(self.calculate_and_display_target)
@@ -1094,8 +1328,14 @@ class BinanceCalculatorApp(QWidget):
             else:
                 logging.warning(f"'{key}'에 대한 단축키 설정이 shortcuts.json에 없습니다.")
 
-    def buffer_order_book_data(self, data):
+    def buffer_order_book_data(self, symbol, data):
+        if symbol != self.current_selected_symbol:
+            return # 종목 변경 직전에 큐에 들어간 이전 종목 프레임은 무시
         self.latest_order_book_data = data
+        top = (data.get('a'), data.get('b'))
+        if top != self._ob_top: # ✨ 상위 호가가 그대로면 다시 그리지 않음
+            self._ob_top = top
+            self._ob_dirty = True
         if data.get('a'):
             try:
                 self.best_ask_price = Decimal(data['a'][0][0])
@@ -1108,31 +1348,29 @@ class BinanceCalculatorApp(QWidget):
                 pass
 
     def update_ui_from_buffer(self):
+        if not self._ob_dirty:
+            return
+        self._ob_dirty = False
         if self.latest_order_book_data:
             self.update_order_book_ui(self.latest_order_book_data)
 
     def update_order_book_ui(self, data):
-        asks = data.get('a', [])
+        asks = data.get('a', [])[::-1] # ✨ 버퍼 원본을 뒤집지 않도록 복사본 사용
         bids = data.get('b', [])
-        
-        asks.reverse()
-        
-        precision = 4 
-        if self.tick_size > Decimal('0'):
-            precision = max(0, -self.tick_size.as_tuple().exponent) 
-            
-        format_string = f"{{:,.{precision}f}} ({{:.3f}})"
-
-        for i, label in enumerate(self.ask_price_labels):
-            if i < len(asks) and Decimal(asks[i][1]) > Decimal('0'):
-                label.setText(format_string.format(Decimal(asks[i][0]), Decimal(asks[i][1])))
-            else:
-                label.setText("N/A")
-        for i, label in enumerate(self.bid_price_labels):
-            if i < len(bids) and Decimal(bids[i][1]) > Decimal('0'):
-                label.setText(format_string.format(Decimal(bids[i][0]), Decimal(bids[i][1])))
-            else:
-                label.setText("N/A")
+        self._render_book_side(self.ask_price_labels, asks, self._last_asks)
+        self._render_book_side(self.bid_price_labels, bids, self._last_bids)
+
+    def _render_book_side(self, labels, rows, last_rows):
+        """✨ (가격, 수량) 문자열이 바뀐 줄만 다시 포맷하고 setText (QLabel은 같은 문자열이어도 다시 그림)"""
+        # 표시 전용이므로 Decimal 대신 float로 포맷 (주문 가격은 Decimal 경로를 그대로 사용)
+        format_string = self._ob_format_string
+        for i, label in enumerate(labels):
+            row = tuple(rows[i]) if i < len(rows) else ()
+            if row == last_rows[i]:
+                continue
+            last_rows[i] = row
+            qty = float(row[1]) if row else 0.0
+            label.setText(format_string.format(float(row[0]), qty) if qty > 0 else "N/A")
 
     def start_worker(self):
         sender = self.sender()
@@ -1140,7 +1378,10 @@ class BinanceCalculatorApp(QWidget):
             sender.finished.disconnect(self.start_worker)
 
         ws_uri = self.config.get('API', 'websocket_base_uri')
-        self.worker = BinanceWorker(self.current_selected_symbol, ws_uri)
+        symbols = self.config.get('TRADING', 'symbols').split(',')
+        if self.current_selected_symbol not in symbols:
+            symbols.append(self.current_selected_symbol)
+        self.worker = BinanceWorker(symbols, self.current_selected_symbol, ws_uri)
         self.worker_thread = QThread()
         self.worker.moveToThread(self.worker_thread)
         self.worker_thread.started.connect(self.worker.run)
@@ -1160,117 +1401,184 @@ class BinanceCalculatorApp(QWidget):
         self.position_timer.stop()
         self.ui_update_timer.stop()
         self.stop_worker()
+        self._pool.shutdown(wait=False)
         event.accept()
 
+    def run_rest_async(self, key, fn, on_done):
+        """
+        ✨ 블로킹 REST 호출 fn()을 스레드 풀에서 실행하고, on_done(future)을 메인 스레드에서 호출합니다.
+        같은 key의 요청이 아직 진행 중이면 중복 요청하지 않습니다.
+        """
+        if key in self._inflight:
+            return
+        self._inflight.add(key)
+
+        def finish(future):
+            self._inflight.discard(key)
+            on_done(future)
+
+        self._pool.submit(fn).add_done_callback(lambda f: self._invoker.invoke.emit(lambda: finish(f)))
+
     def manual_refresh_data(self):
         logging.info("사용자가 수동으로 데이터 새로고침을 요청했습니다.")
         self.is_retry_scheduled = False
         self.update_asset_balance()
+        self.update_position_status(force=True)
+        self.update_open_orders_status(force=True)
+
+    def refresh_account_status(self):
+        """✨ 타이머 1회에 포지션/미체결 주문 조회를 함께 스레드 풀에 올려 동시에 실행합니다."""
         self.update_position_status()
         self.update_open_orders_status()
 
-    def update_open_orders_status(self):
+    def _set_display(self, widget, text, html=True):
+        """✨ 내용이 바뀐 경우에만 QTextEdit를 다시 그립니다. (HTML 파싱/레이아웃 비용 절감)"""
+        if self._last_display_text.get(widget) == text:
+            return
+        self._last_display_text[widget] = text
+        if html:
+            widget.setHtml(text)
+        else:
+            widget.setText(text)
+
+    def _rest_is_fresh(self, key):
+        return time.monotonic() - self._rest_fetched_at.get(key, 0.0) < REST_CACHE_TTL
+
+    def update_open_orders_status(self, force=False):
+        symbol = self.current_selected_symbol
+        if not force and self._rest_is_fresh(('open_orders', symbol)):
+            return # ✨ 1초 안에 조회한 결과가 있으면 다시 요청하지 않음
+        self.run_rest_async(('open_orders', symbol),
+                            lambda: self.client.futures_get_open_orders(symbol=symbol),
+                            lambda f: self._apply_open_orders(symbol, f))
+
+    def _apply_open_orders(self, symbol, future):
+        if symbol != self.current_selected_symbol:
+            return # 응답 도착 전에 종목이 바뀐 경우 무시
         try:
-            orders = self.client.futures_get_open_orders(symbol=self.current_selected_symbol)
+            orders = future.result()
+            self._rest_fetched_at[('open_orders', symbol)] = time.monotonic()
+            # ✨ 응답과 표시 포맷이 이전과 같으면 QTextEdit를 다시 그리지 않음
+            render_key = (symbol, orders, self.tick_size)
+            if render_key == self._last_orders_render:
+                return
+            self._last_orders_render = render_key
             if not orders:
-                self.open_orders_display.setText(f"현재 {self.current_selected_symbol} 미체결 주문 없음")
+                self._set_display(self.open_orders_display, f"현재 {self.current_selected_symbol} 미체결 주문 없음", html=False)
                 return
-            display_text = ""
-            precision = 2 
-            if self.tick_size > Decimal('0'):
-                precision = max(0, -self.tick_size.as_tuple().exponent)
-            price_format = f",.{precision}f"
+            parts = [] # ✨ 문자열 += 누적 대신 리스트에 모아 마지막에 한 번만 join
+            price_format = self._price_format # ✨ 종목 정보 로드 시 계산된 포맷 사용
             
             for o in orders:
                 side_color = "red" if o['side'] == 'SELL' else "blue" 
-                display_text += (f"<b style='font-size:11pt;'>{o['symbol']} <span style='color:{side_color}';>{o['side']}</span></b><br>"
-                                 f" - <b>가격:</b> ${Decimal(o['price']):{price_format}}<br>"
-                                 f" - <b>수량:</b> {Decimal(o['origQty'])}<br>"
-                                 "--------------------------<br>")
-            self.open_orders_display.setHtml(display_text)
+                parts.append(f"<b style='font-size:11pt;'>{o['symbol']} <span style='color:{side_color}';>{o['side']}</span></b><br>"
+                             f" - <b>가격:</b> ${Decimal(o['price']):{price_format}}<br>"
+                             f" - <b>수량:</b> {Decimal(o['origQty'])}<br>"
+                             "--------------------------<br>")
+            self._set_display(self.open_orders_display, "".join(parts))
         except Exception as e:
             logging.error(f"미체결 주문 로드 실패: {e}", exc_info=True)
-            self.open_orders_display.setText(f"미체결 주문 로드 실패:\n{e}")
+            self._last_orders_render = None
+            self._set_display(self.open_orders_display, f"미체결 주문 로드 실패:\n{e}", html=False)
 
-    def update_position_status(self):
+    def update_position_status(self, force=False):
+        symbol = self.current_selected_symbol
+        if not force and self._rest_is_fresh(('positions', symbol)):
+            return
+        # futures_account()의 positions 항목에는 markPrice/liquidationPrice가 없어 포지션 패널에 쓸 수 없음.
+        # 주기 갱신(refresh_account_status)은 잔고를 조회하지 않으므로 심볼 단위 조회 1회만 발생합니다.
+        self.run_rest_async(('positions', symbol),
+                            lambda: self.client.futures_position_information(symbol=symbol),
+                            lambda f: self._apply_position_status(symbol, f))
+
+    def _apply_position_status(self, symbol, future):
+        if symbol != self.current_selected_symbol:
+            return # 응답 도착 전에 종목이 바뀐 경우 무시
         try:
-            positions = self.client.futures_position_information(symbol=self.current_selected_symbol)
-            open_positions = [p for p in positions if Decimal(p['positionAmt']) != Decimal('0')]
+            positions = future.result()
+            self._rest_fetched_at[('positions', symbol)] = time.monotonic()
+            # ✨ nTP/nROE는 레버리지·ROI 입력값에도 의존하므로 함께 비교
+            render_key = (symbol, positions, self.leverage_input.text(), self.roi_input.text(), self.tick_size)
+            if render_key == self._last_positions_render:
+                return
+            self._last_positions_render = render_key
+            open_positions = [p for p in positions if _nonzero_amt(p['positionAmt'])]
 
             if not open_positions:
-                self.position_display.setText(f"현재 {self.current_selected_symbol} 포지션이 없습니다.")
+                self._set_display(self.position_display, f"현재 {self.current_selected_symbol} 포지션이 없습니다.", html=False)
                 self.calculated_ntp_decimal = None
                 return
 
-            precision = 2 
-            if self.tick_size > Decimal('0'):
-                precision = max(0, -self.tick_size.as_tuple().exponent)
-            price_format = f",.{precision}f"
-            
-            display_text = ""
+            price_format = self._price_format # ✨ 종목 정보 로드 시 계산된 포맷 사용
+            # ✨ 레버리지/목표 ROI는 포지션마다 다시 읽지 않고 한 번만 파싱 (수수료율은 시작 시 캐시)
+            taker_fee_rate = self._taker_fee_rate
+            maker_fee_rate = self._maker_fee_rate
+            taker_fee_f = self._taker_fee_f
+            maker_fee_f = self._maker_fee_f
+            leverage = self.leverage_input.value
+            if leverage is None:
+                leverage = Decimal('0')
+            leverage_f = float(leverage)
+            target_roi_percent = self.roi_input.value
+
+            parts = []
             for p in open_positions:
-                pnl = Decimal(p['unRealizedProfit'])
-                entry_price = Decimal(p['entryPrice'])
-                position_amt = Decimal(p['positionAmt'])
-                mark_price = Decimal(p['markPrice'])
+                # ✨ 화면 표시용 손익/ROE는 float로 계산 (Decimal은 Tick 단위 nTP 계산에만 사용)
+                pnl = float(p['unRealizedProfit'])
+                entry_price = float(p['entryPrice'])
+                position_amt = float(p['positionAmt'])
+                mark_price = float(p['markPrice'])
                 position_side = "LONG" if position_amt > 0 else "SHORT"
-                liq_price = Decimal(p['liquidationPrice'])
+                liq_price = float(p['liquidationPrice'])
+                abs_amt = abs(position_amt)
                 
-                taker_fee_rate = Decimal(self.config.get('TRADING', 'taker_fee_rate'))
-                maker_fee_rate = Decimal(self.config.get('TRADING', 'maker_fee_rate'))
-                entry_notional = entry_price * position_amt.copy_abs()
-                current_notional = mark_price * position_amt.copy_abs()
-                entry_fee = entry_notional * taker_fee_rate
-                closing_fee = current_notional * maker_fee_rate
+                entry_notional = entry_price * abs_amt
+                current_notional = mark_price * abs_amt
+                entry_fee = entry_notional * taker_fee_f
+                closing_fee = current_notional * maker_fee_f
                 net_pnl = pnl - entry_fee - closing_fee
-                net_color = "green" if net_pnl >= Decimal('0') else "black" 
+                net_color = "green" if net_pnl >= 0 else "black" 
 
-                leverage = Decimal('0')
                 net_roe_text = "N/A"
-                try:
-                    leverage = Decimal(self.leverage_input.text())
-                except Exception:
-                    pass
-                if leverage > Decimal('0'):
-                    margin = entry_price * position_amt.copy_abs() / leverage
-                    if margin != Decimal('0'):
-                        net_roe = (net_pnl / margin) * Decimal('100')
+                if leverage_f > 0:
+                    margin = entry_notional / leverage_f
+                    if margin != 0:
+                        net_roe = net_pnl / margin * 100
                         net_roe_text = f"{net_roe:.2f}%"
                     else:
                         net_roe_text = "0.00%"
                 
                 nTP_text = "N/A"
                 try:
-                    target_roi_percent = Decimal(self.roi_input.text())
-                    if leverage > Decimal('0') and target_roi_percent > Decimal('0'):
-                        target_roi = target_roi_percent / Decimal('100')
-                        if position_side == 'LONG':
-                            nTP = entry_price * (Decimal('1') + (target_roi / leverage) + taker_fee_rate) / (Decimal('1') - maker_fee_rate)
-                        else:
-                            nTP = entry_price * (Decimal('1') - (target_roi / leverage) - taker_fee_rate) / (Decimal('1') + maker_fee_rate)
+                    if leverage > Decimal('0') and target_roi_percent is not None and target_roi_percent > Decimal('0'):
+                        # 진입은 Taker, 청산은 Maker 수수료 기준 (목표가 주문 가격이므로 Decimal 경로 사용)
+                        nTP = calculate_target_price(Decimal(p['entryPrice']), leverage, target_roi_percent,
+                                                     position_side, taker_fee_rate, maker_fee_rate)
                         if self.tick_size > Decimal('0'):
                             rounding_mode = ROUND_CEILING if position_side == 'LONG' else ROUND_FLOOR
                             adjusted_nTP = nTP.quantize(self.tick_size, rounding=rounding_mode)
                         else:
                             adjusted_nTP = nTP
                         self.calculated_ntp_decimal = adjusted_nTP
+                        self.calculated_ntp_symbol = symbol
                         nTP_text = f"${adjusted_nTP:{price_format}}"
                 except Exception as e:
+                    self.calculated_ntp_decimal = None
                     logging.warning(f"nTP 계산 중 오류: {e}")
 
-                display_text += (f"<b style='font-size:11pt;'>{p['symbol']} <span style='color:{'red' if position_side == 'LONG' else 'blue'};'>({position_side})</span></b><br>"
-                                 f" - <b>수익(nPNL):</b> <span style='color:{net_color};'><b>${net_pnl:,.2f}</b></span><br>"
-                                 f" - <b>수익률(nROE):</b> <span style='color:{net_color};'><b>{net_roe_text}</b></span><br>"
-                                 f" - <b>목표가(nTP):</b> <span style='color:green;'><b>{nTP_text}</b></span><br>"
-                                 f" - <b>진입가:</b> ${entry_price:{price_format}}<br>"
-                                 f" - <b>시장가:</b> ${mark_price:{price_format}}<br>"
-                                 f" - <b>청산가:</b> <span style='color:orange;'>${liq_price:{price_format}}</span><br>"
-                                 f" - <b>수량:</b> {position_amt.copy_abs()}<br>"
-                                 f"--------------------------<br>")
-            self.position_display.setHtml(display_text)
+                parts.append(self._POS_TEMPLATE % {
+                    'symbol': p['symbol'], 'position_color': 'red' if position_side == 'LONG' else 'blue',
+                    'position_side': position_side, 'net_color': net_color, 'net_pnl': format(net_pnl, ',.2f'),
+                    'net_roe': net_roe_text, 'ntp': nTP_text,
+                    'entry_price': format(entry_price, price_format), 'mark_price': format(mark_price, price_format),
+                    'liq_price': format(liq_price, price_format), 'quantity': p['positionAmt'].lstrip('-'),
+                })
+            self._set_display(self.position_display, "".join(parts))
         except Exception as e:
             logging.error(f"포지션 정보 로드 실패: {e}", exc_info=True)
-            self.position_display.setText(f"포지션 정보 로드 실패:\n{e}")
+            self._last_positions_render = None
+            self.calculated_ntp_decimal = None
+            self._set_display(self.position_display, f"포지션 정보 로드 실패:\n{e}", html=False)
 
     def format_entry_price(self):
         try:
@@ -1287,56 +1595,140 @@ class BinanceCalculatorApp(QWidget):
 
     def adjust_price(self, price: Decimal) -> Decimal:
         if self.tick_size == Decimal('0'): return price
-        return price.quantize(self.tick_size, rounding=ROUND_DOWN)
+        return _round_down_to_step(price, self._tick_exp, self._tick_int)
 
     def adjust_quantity(self, quantity: Decimal) -> Decimal:
         if self.step_size == Decimal('0'): return quantity
-        return quantity.quantize(self.step_size, rounding=ROUND_DOWN)
+        return _round_down_to_step(quantity, self._step_exp, self._step_int)
 
     def fetch_symbol_info(self):
+        """
+        ✨ 거래소 정보가 캐시되어 있으면 Tick/Step을 즉시 반영하고, 나머지 조회(레버리지 구간, 만료된 거래소 정보)만
+        스레드 풀에서 실행합니다. 결과가 반영되기 전까지는 주문 경로가 이전 종목의 값을 쓰지 않도록 막습니다.
+        """
+        symbol = self.current_selected_symbol
+        # 이전 종목의 Tick/Step Size·레버리지 구간으로 주문하지 않도록 초기화
+        self._symbol_info_symbol = None
+        self.leverage_brackets = []
+        self._tier_floors, self._tier_caps, self._tier_lev = [], [], []
+        # 전체 심볼 목록은 TTL 동안 재사용 (종목 변경마다 수백 KB 재조회 → -1003 방지)
+        info_stale = not self._exchange_info_by_symbol or time.monotonic() - self._exchange_info_time > EXCHANGE_INFO_TTL
+        if info_stale:
+            self._apply_symbol_filters(None)
+        else:
+            self._apply_symbol_filters(symbol)
+
+        def fetch():
+            info = self.client.futures_exchange_info() if info_stale else None
+            return info, self.client.futures_leverage_bracket(symbol=symbol)
+
+        self.run_rest_async(('symbol_info', symbol), fetch,
+                            lambda future: self._apply_symbol_info(symbol, future))
+
+    def _apply_symbol_filters(self, symbol):
+        """캐시된 거래소 정보에서 symbol의 Tick/Step Size를 반영합니다. (없으면 0으로 초기화)"""
+        s = self._exchange_info_by_symbol.get(symbol)
+        filters = self._filters_by_symbol.get(symbol, {})
+        self.symbol_info = s or {}
+        price_filter = filters.get('PRICE_FILTER')
+        tick_size = Decimal(price_filter['tickSize']).normalize() if price_filter else Decimal('0')
+        # ✨ Tick Size가 같으면(같은 종목 재조회, 같은 정밀도 종목으로 전환) 포맷 캐시를 그대로 유지
+        if tick_size != self.tick_size:
+            self.tick_size = tick_size
+            self._recompute_ob_format()
+            if self.tick_size > Decimal('0'):
+                self._tick_exp, self._tick_int = _step_to_int(self.tick_size)
+        lot_size = filters.get('LOT_SIZE')
+        self.step_size = Decimal(lot_size['stepSize']) if lot_size else Decimal('0')
+        if self.step_size > Decimal('0'):
+            self._step_exp, self._step_int = _step_to_int(self.step_size)
+        if s is not None:
+            logging.info(f"✅ {symbol} Tick Size: {self.tick_size}, Step Size: {self.step_size}")
+        return s is not None
+
+    def _apply_symbol_info(self, symbol, future):
         try:
-            info = self.client.futures_exchange_info()
-            for s in info['symbols']:
-                if s['symbol'] == self.current_selected_symbol:
-                    self.symbol_info = s
-                    for f in s['filters']:
-                        if f['filterType'] == 'PRICE_FILTER':
-                            self.tick_size = Decimal(f['tickSize']).normalize()  
-                            logging.info(f"✅ {self.current_selected_symbol} Tick Size Fetched: {self.tick_size}")
-                        if f['filterType'] == 'LOT_SIZE':
-                            self.step_size = Decimal(f['stepSize'])
-            leverage_brackets_data = self.client.futures_leverage_bracket(symbol=self.current_selected_symbol)
+            info, leverage_brackets_data = future.result()
+        except Exception as e:
+            logging.error(f"종목 정보 로드 실패: {e}", exc_info=True)
+            return # _symbol_info_symbol이 비어 있으므로 주문 경로는 계속 차단됨
+        try:
+            if info is not None:
+                # 종목이 그새 바뀌었어도 새로 받은 거래소 정보는 캐시에 저장해 다음 종목에서 재사용
+                self._exchange_info_by_symbol = {s['symbol']: s for s in info['symbols']}
+                # ✨ 필터 목록도 캐시 생성 시 한 번만 filterType 기준 dict로 변환
+                self._filters_by_symbol = {sym: {f['filterType']: f for f in s['filters']}
+                                           for sym, s in self._exchange_info_by_symbol.items()}
+                self._exchange_info_time = time.monotonic()
+            if symbol != self.current_selected_symbol:
+                return # 조회 중에 종목이 바뀜 → 새 종목의 조회 결과를 사용
+            if not self._apply_symbol_filters(symbol):
+                logging.error(f"종목 정보 로드 실패: 거래소 정보에 {symbol}이(가) 없습니다.")
+                return
             if leverage_brackets_data:
                 self.leverage_brackets = leverage_brackets_data[0]['brackets']
+                self._tier_floors = [Decimal(str(t['notionalFloor'])) for t in self.leverage_brackets]
+                self._tier_caps = [Decimal(str(t['notionalCap'])) for t in self.leverage_brackets]
+                self._tier_lev = [Decimal(str(t['initialLeverage'])) for t in self.leverage_brackets]
                 max_leverage = int(self.leverage_brackets[0]['initialLeverage'])
                 logging.info(
-                    f"{self.current_selected_symbol} 정보 로드: Tick Size {self.tick_size}, Step Size {self.step_size}, Max Leverage {max_leverage}x")
+                    f"{symbol} 정보 로드: Tick Size {self.tick_size}, Step Size {self.step_size}, Max Leverage {max_leverage}x")
                 self.leverage_input.setValidator(QDoubleValidator(1.0, float(max_leverage), 0))
                 self.leverage_label.setToolTip(f"이 종목의 최대 레버리지는 {max_leverage}배입니다.")
                 if self.leverage_input.text() and int(self.leverage_input.text()) > max_leverage:
                     self.leverage_input.setText(str(max_leverage))
-            return
+            self._symbol_info_symbol = symbol
+            # 새 Tick/Step/구간이 반영되었으므로 목표가 다시 계산
+            self.calculate_and_display_target()
         except Exception as e:
             logging.error(f"종목 정보 로드 실패: {e}", exc_info=True)
-            self.tick_size = Decimal('0')
-            self.step_size = Decimal('0')
+
+    def _check_symbol_info_ready(self, symbol=None, title="주문 오류"):
+        """
+        ✨ symbol(기본: 현재 종목)의 Tick/Step/레버리지 구간이 반영되었는지 확인합니다.
+        아직이면 경고를 띄우고, 진행 중인 조회가 없으면 다시 요청합니다.
+        """
+        symbol = symbol or self.current_selected_symbol
+        if self._symbol_info_symbol == symbol:
+            return True
+        QMessageBox.warning(self, title, f"{symbol} 종목 정보(Tick/Step Size)를 불러오는 중입니다. 잠시 후 다시 시도해주세요.")
+        if symbol == self.current_selected_symbol and ('symbol_info', symbol) not in self._inflight:
+            self.fetch_symbol_info()
+        return False
+
+    def _recompute_ob_format(self):
+        """✨ Tick Size가 바뀔 때만 가격 정밀도와 표시 포맷을 다시 계산합니다."""
+        if self.tick_size > Decimal('0'):
+            self._ob_precision = max(0, -self.tick_size.as_tuple().exponent)
+            self._price_format = f",.{self._ob_precision}f"
+        else:
+            self._ob_precision = 4 # 호가 기본 4자리, 주문/포지션 기본 2자리
+            self._price_format = ",.2f"
+        self._ob_format_string = f"{{:,.{self._ob_precision}f}} ({{:.3f}})"
+        # 포맷이 바뀌었으므로 모든 호가 줄을 다시 그리도록 초기화
+        self._last_asks = [None] * 5
+        self._last_bids = [None] * 5
+        self._ob_dirty = True
 
     def get_adjusted_max_notional(self, desired_notional, selected_leverage):
-        if not self.leverage_brackets:
+        if not self._tier_caps:
             return (desired_notional, selected_leverage)
-        for tier in self.leverage_brackets:
-            if desired_notional > Decimal(str(tier['notionalFloor'])) and desired_notional <= Decimal(str(tier['notionalCap'])):
-                allowed_leverage = Decimal(str(tier['initialLeverage']))
-                if selected_leverage > allowed_leverage:
-                    logging.warning(
-                        f"레버리지 조정: 포지션 규모 ${desired_notional:,.0f} USDT는 최대 {allowed_leverage}배 레버리지만 허용됩니다.")
-                    return (self.available_balance * allowed_leverage, allowed_leverage)
-                break
+        # ✨ 구간 상한은 오름차순이므로 이진 탐색으로 notionalCap >= desired_notional 인 첫 구간을 찾음
+        i = bisect.bisect_left(self._tier_caps, desired_notional)
+        if i < len(self._tier_caps) and desired_notional > self._tier_floors[i]:
+            allowed_leverage = self._tier_lev[i]
+            if selected_leverage > allowed_leverage:
+                logging.warning(
+                    f"레버리지 조정: 포지션 규모 ${desired_notional:,.0f} USDT는 최대 {allowed_leverage}배 레버리지만 허용됩니다.")
+                return (self.available_balance * allowed_leverage, allowed_leverage)
         return (desired_notional, selected_leverage)
 
     def update_asset_balance(self):
+        self.run_rest_async('account', self.client.futures_account, self._apply_asset_balance)
+
+    def _apply_asset_balance(self, future):
         try:
-            account_info = self.client.futures_account()
+            account_info = future.result()
             total_balance = Decimal(account_info['totalWalletBalance'])
             self.asset_group_box.setTitle(f"자산 현황 (총: ${total_balance:,.2f} USDT)")
             for asset in account_info['assets']:
@@ -1350,6 +1742,8 @@ class BinanceCalculatorApp(QWidget):
             self.balance_label.setText("자산 로드 실패")
 
     def place_order_logic(self, order_type):
+        if not self._check_symbol_info_ready():
+            return
         try:
             symbol = self.current_selected_symbol
             total_quantity_text = self.quantity_input.text()
@@ -1379,7 +1773,8 @@ class BinanceCalculatorApp(QWidget):
                 side = Client.SIDE_BUY if self.position_type == 'long' else Client.SIDE_SELL
             elif order_type == 'target':
                 title = "Target Price Limit"
-                if self.calculated_ntp_decimal is None:
+                # ✨ 포지션은 비동기로 로드되므로, 현재 종목 기준으로 계산된 nTP가 아니면 주문하지 않음
+                if self.calculated_ntp_decimal is None or self.calculated_ntp_symbol != symbol:
                     QMessageBox.warning(self, "주문 오류", "포지션 현황의 목표가(nTP)가 먼저 계산되어야 합니다.")
                     return
                 center_price = self.calculated_ntp_decimal
@@ -1391,7 +1786,6 @@ class BinanceCalculatorApp(QWidget):
                 QMessageBox.warning(self, "주문 오류", "총 주문 수량은 0보다 커야 합니다.")
                 return
 
-            orders_to_place = []
             quantity_per_order = total_quantity / Decimal(grid_count)
             grid_interval_text = self.grid_interval_input.text()
             if not grid_interval_text:
@@ -1400,38 +1794,61 @@ class BinanceCalculatorApp(QWidget):
             price_interval = Decimal(grid_interval_text) * self.tick_size
             start_offset = -(Decimal(grid_count) - Decimal('1')) / Decimal('2')
             
-            for i in range(grid_count):
-                price_offset = (start_offset + Decimal(i)) * price_interval
-                price = center_price + price_offset
-                if self.tick_size > Decimal('0'):
-                    if order_type == 'entry':
-                        rounding_mode = ROUND_DOWN if self.position_type == 'long' else ROUND_CEILING
-                    else:
-                        rounding_mode = ROUND_HALF_UP
-                    adjusted_price = price.quantize(self.tick_size, rounding=rounding_mode)
-                else:
-                    adjusted_price = price
-                adjusted_quantity = self.adjust_quantity(quantity_per_order)
-                orders_to_place.append({'price': str(adjusted_price.normalize()), 'quantity': str(adjusted_quantity.normalize())})
+            # ✨ 반올림 방식과 주문당 수량은 루프와 무관하므로 한 번만 결정
+            if order_type == 'entry':
+                rounding_mode = ROUND_DOWN if self.position_type == 'long' else ROUND_CEILING
+            else:
+                rounding_mode = ROUND_HALF_UP
+            quantity_str = str(self.adjust_quantity(quantity_per_order).normalize())
+            prices = [center_price + (start_offset + i) * price_interval for i in range(grid_count)]
+            if self.tick_size > Decimal('0'):
+                prices = [price.quantize(self.tick_size, rounding=rounding_mode) for price in prices]
+            orders_to_place = [{'price': str(price.normalize()), 'quantity': quantity_str} for price in prices]
 
             logging.info(f"'{title}' 확인 없이 즉시 실행: {grid_count}개 분할, 총 수량 {total_quantity}")
             success_count = 0
             failed_orders = []
+            valid_orders = []
             for order in orders_to_place:
                 if Decimal(order['quantity']) <= Decimal('0'):
                     logging.warning(f"수량 0으로 주문 건너뜀: {order}")
                     continue
+                valid_orders.append(order)
+
+            reduce_only = order_type == 'target'
+            # ✨ batchOrders API로 최대 5개씩 묶어 전송 (주문당 HTTPS 왕복 → 5개당 1회), 1건이면 단일 주문 API 사용
+            for start in range(0, len(valid_orders), 5):
+                chunk = valid_orders[start:start + 5]
+                logging.info(
+                    f"🚀 Placing Orders: SYMBOL={symbol}, SIDE={side}, ReduceOnly={reduce_only}, ORDERS={chunk}")
+                if len(chunk) == 1:
+                    order = chunk[0]
+                    try:
+                        self.client.futures_create_order(symbol=symbol, side=side, type=Client.ORDER_TYPE_LIMIT,
+                                                         timeInForce=Client.TIME_IN_FORCE_GTC, quantity=order['quantity'],
+                                                         price=order['price'], reduceOnly=reduce_only)
+                        success_count += 1
+                    except Exception as e:
+                        failed_orders.append((order, e))
+                        logging.error(f"주문 실패 (가격: {order['price']}, 수량: {order['quantity']}): {e}", exc_info=True)
+                    continue
+
+                batch = [{'symbol': symbol, 'side': side, 'type': Client.ORDER_TYPE_LIMIT,
+                          'timeInForce': Client.TIME_IN_FORCE_GTC, 'quantity': o['quantity'],
+                          'price': o['price'], 'reduceOnly': 'true' if reduce_only else 'false'} for o in chunk]
                 try:
-                    reduce_only = True if order_type == 'target' else False
-                    logging.info(
-                        f"🚀 Placing Order: SYMBOL={symbol}, SIDE={side}, QTY={order['quantity']}, PRICE={order['price']}, ReduceOnly={reduce_only}")
-                    self.client.futures_create_order(symbol=symbol, side=side, type=Client.ORDER_TYPE_LIMIT,
-                                                     timeInForce=Client.TIME_IN_FORCE_GTC, quantity=order['quantity'],
-                                                     price=order['price'], reduceOnly=reduce_only)
-                    success_count += 1
+                    results = self.client.futures_place_batch_order(batchOrders=batch)
                 except Exception as e:
-                    failed_orders.append((order, e))
-                    logging.error(f"주문 실패 (가격: {order['price']}, 수량: {order['quantity']}): {e}", exc_info=True)
+                    failed_orders.extend((o, e) for o in chunk)
+                    logging.error(f"일괄 주문 실패 ({len(chunk)}건): {e}", exc_info=True)
+                    continue
+                # 응답은 주문 순서대로 반환되며, 실패한 항목은 {"code": ..., "msg": ...} 형태
+                for order, result in zip(chunk, results):
+                    if 'orderId' in result:
+                        success_count += 1
+                    else:
+                        failed_orders.append((order, result.get('msg', result)))
+                        logging.error(f"주문 실패 (가격: {order['price']}, 수량: {order['quantity']}): {result}")
 
             logging.info(f"주문 결과: {success_count}/{grid_count} 성공.")
             if failed_orders:
@@ -1444,42 +1861,88 @@ class BinanceCalculatorApp(QWidget):
             QMessageBox.critical(self, "오류", f"주문 처리 중 오류가 발생했습니다: {e}")
 
     def emergency_market_close(self):
+        """✨ 포지션 조회 → 청산/취소 주문 제출을 모두 백그라운드에서 실행하고, 결과만 메인 스레드에서 표시합니다."""
+        if 'emergency_close' in self._inflight:
+            logging.info("비상 청산이 이미 진행 중입니다.")
+            return
+        self.run_rest_async('emergency_positions', self.client.futures_position_information,
+                            self._on_emergency_positions)
+
+    def _on_emergency_positions(self, future):
         try:
-            positions = self.client.futures_position_information()
-            open_positions = [p for p in positions if float(p['positionAmt']) != 0]
-            if not open_positions:
-                logging.info("비상 청산 시도: 청산할 포지션이 없습니다.")
-                QMessageBox.information(self, "알림", "청산할 포지션이 없습니다.")
-                return
-            logging.warning(f"🚨🚨 비상 시장가 즉시 청산 기능 실행! ({len(open_positions)}개 포지션)")
+            positions = future.result()
+        except Exception as e:
+            logging.critical(f"비상 청산 기능 실행 중 치명적 오류: {e}", exc_info=True)
+            QMessageBox.critical(self, "치명적 오류", f"비상 청산 기능 실행 중 치명적 오류가 발생했습니다: {e}")
+            return
+        open_positions = [p for p in positions if _nonzero_amt(p['positionAmt'])]
+        if not open_positions:
+            logging.info("비상 청산 시도: 청산할 포지션이 없습니다.")
+            QMessageBox.information(self, "알림", "청산할 포지션이 없습니다.")
+            return
+        logging.warning(f"🚨🚨 비상 시장가 즉시 청산 기능 실행! ({len(open_positions)}개 포지션)")
+        tasks = []
+        for p in open_positions:
+            position_amt = float(p['positionAmt'])
+            side = Client.SIDE_SELL if position_amt > 0 else Client.SIDE_BUY
+            tasks.append((p['symbol'], side, abs(position_amt)))
+
+        def _close(task):
+            symbol, side, quantity = task
+            return self.client.futures_create_order(symbol=symbol, side=side, type=Client.ORDER_TYPE_MARKET,
+                                                    quantity=quantity, reduceOnly=True)
+
+        def close_all():
+            # 백그라운드 스레드에서 실행: 위젯은 건드리지 않고 결과만 반환
             success_count = 0
-            for p in open_positions:
-                symbol = p['symbol']
-                position_amt = float(p['positionAmt'])
-                side = Client.SIDE_SELL if position_amt > 0 else Client.SIDE_BUY
-                quantity = abs(position_amt)
-                try:
-                    self.client.futures_create_order(symbol=symbol, side=side, type=Client.ORDER_TYPE_MARKET,
-                                                     quantity=quantity, reduceOnly=True)
-                    success_count += 1
-                    logging.info(f"✅ {symbol} 포지션 시장가 청산 주문 제출 완료.")
-                except Exception as e:
-                    logging.error(f"❌ {symbol} 포지션 청산 중 오류 발생: {e}", exc_info=True)
-                    QMessageBox.critical(self, "청산 오류", f"{symbol} 포지션 청산 중 오류 발생:\n{e}")
-            for p in open_positions:
-                try:
-                    self.client.futures_cancel_all_open_orders(symbol=p['symbol'])
-                    logging.info(f"✅ {p['symbol']} 미체결 주문 전체 취소 완료.")
-                except Exception as e:
-                    logging.warning(f"⚠️ {p['symbol']} 미체결 주문 취소 중 오류 발생 (무시 가능): {e.message if hasattr(e, 'message') else str(e)}")
-            self.manual_refresh_data()
-            if success_count == len(open_positions):
-                QMessageBox.information(self, "즉시 청산 완료", f"모든 {success_count}개 포지션에 대한 청산 주문을 제출했습니다.", QMessageBox.Ok)
-            else:
-                 QMessageBox.warning(self, "부분 청산 완료", f"총 {len(open_positions)}개 포지션 중 {success_count}개 청산 주문 제출. 로그를 확인하세요.", QMessageBox.Ok)
+            failed = []
+            # ✨ 청산 주문을 심볼별로 동시에 제출 (K개 포지션 기준 K×RTT → 약 1×RTT)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(tasks))) as ex:
+                futures = {ex.submit(_close, t): t for t in tasks}
+                for f in concurrent.futures.as_completed(futures):
+                    symbol = futures[f][0]
+                    try:
+                        f.result()
+                        success_count += 1
+                        logging.info(f"✅ {symbol} 포지션 시장가 청산 주문 제출 완료.")
+                    except Exception as e:
+                        failed.append((symbol, e))
+                        logging.error(f"❌ {symbol} 포지션 청산 중 오류 발생: {e}", exc_info=True)
+
+                cancel_futures = {ex.submit(self.client.futures_cancel_all_open_orders, symbol=t[0]): t[0] for t in tasks}
+                for f in concurrent.futures.as_completed(cancel_futures):
+                    symbol = cancel_futures[f]
+                    try:
+                        f.result()
+                        logging.info(f"✅ {symbol} 미체결 주문 전체 취소 완료.")
+                    except Exception as e:
+                        logging.warning(f"⚠️ {symbol} 미체결 주문 취소 중 오류 발생 (무시 가능): {e.message if hasattr(e, 'message') else str(e)}")
+            return len(tasks), success_count, failed
+
+        # 공용 _pool은 주기 조회가 점유 중일 수 있으므로 전용 스레드에서 실행
+        self._inflight.add('emergency_close')
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        executor.submit(close_all).add_done_callback(
+            lambda f: self._invoker.invoke.emit(lambda: self._on_emergency_close_done(f)))
+        executor.shutdown(wait=False)
+
+    def _on_emergency_close_done(self, future):
+        self._inflight.discard('emergency_close')
+        try:
+            total, success_count, failed = future.result()
         except Exception as e:
             logging.critical(f"비상 청산 기능 실행 중 치명적 오류: {e}", exc_info=True)
             QMessageBox.critical(self, "치명적 오류", f"비상 청산 기능 실행 중 치명적 오류가 발생했습니다: {e}")
+            self.manual_refresh_data()
+            return
+        if failed:
+            details = "\n".join(f"{symbol}: {e}" for symbol, e in failed)
+            QMessageBox.critical(self, "청산 오류", f"다음 포지션 청산 중 오류 발생:\n{details}")
+        self.manual_refresh_data()
+        if success_count == total:
+            QMessageBox.information(self, "즉시 청산 완료", f"모든 {success_count}개 포지션에 대한 청산 주문을 제출했습니다.", QMessageBox.Ok)
+        else:
+            QMessageBox.warning(self, "부분 청산 완료", f"총 {total}개 포지션 중 {success_count}개 청산 주문 제출. 로그를 확인하세요.", QMessageBox.Ok)
 
     def place_entry_order(self):
         self.place_order_logic('entry')
@@ -1494,15 +1957,17 @@ class BinanceCalculatorApp(QWidget):
             percentage = 100  # Max는 무조건 100%
             self.slider_label.setText(f"{percentage}%")
             self.quantity_slider.setValue(percentage) # 슬라이더 UI는 100으로 동기화 (시그널 발생 여부 무시)
+            self._slider_timer.stop() # ✨ 수량은 아래에서 직접 계산하므로 슬라이더 재계산 취소
+            if not self._check_symbol_info_ready(title="계산 오류"): return
 
-            if not self.leverage_input.text() or self.available_balance <= 0: return
+            if self.leverage_input.value is None or self.available_balance <= 0: return
 
-            leverage = Decimal(self.leverage_input.text())
+            leverage = self.leverage_input.value
             # '기준 가격' 필드가 비어있으면 호가창 가격을 사용, 둘 다 없으면 리턴
             entry_price = self.best_ask_price if self.position_type != 'short' else self.best_bid_price
             if entry_price <= Decimal('0'):
-                if self.entry_price_input.text() and Decimal(self.entry_price_input.text()) > 0:
-                    entry_price = Decimal(self.entry_price_input.text())
+                if self.entry_price_input.value is not None and self.entry_price_input.value > 0:
+                    entry_price = self.entry_price_input.value
                 else:
                     return
 
@@ -1532,15 +1997,21 @@ class BinanceCalculatorApp(QWidget):
             QMessageBox.warning(self, "계산 오류", f"Max 수량 계산 중 오류가 발생했습니다:\n{e}")
 
     def update_quantity_from_slider(self):
+        """슬라이더 값 변경 시 라벨만 즉시 갱신하고 수량 계산은 디바운스 타이머에 맡깁니다."""
+        self.slider_label.setText(f"{self.quantity_slider.value()}%")
+        self._slider_timer.start()
+
+    def _do_quantity_update(self):
+        if self._symbol_info_symbol != self.current_selected_symbol:
+            return # 종목 정보 반영 전에는 이전 종목의 Step/구간으로 수량을 채우지 않음
         try:
             percentage = self.quantity_slider.value()
-            self.slider_label.setText(f"{percentage}%")
-            if not self.leverage_input.text() or self.available_balance <= 0: return
-            leverage = Decimal(self.leverage_input.text())
+            if self.leverage_input.value is None or self.available_balance <= 0: return
+            leverage = self.leverage_input.value
             entry_price = self.best_ask_price if self.position_type != 'short' else self.best_bid_price
             if entry_price <= Decimal('0'):
-                if self.entry_price_input.text() and Decimal(self.entry_price_input.text()) > 0:
-                    entry_price = Decimal(self.entry_price_input.text())
+                if self.entry_price_input.value is not None and self.entry_price_input.value > 0:
+                    entry_price = self.entry_price_input.value
                 else:
                     return
             max_usdt_value = self.available_balance * leverage
@@ -1566,7 +2037,17 @@ class BinanceCalculatorApp(QWidget):
         logging.info(f"거래 종목 변경: {symbol}")
         self.current_selected_symbol = symbol
         self.order_book_group_box.setTitle(f"{self.current_selected_symbol} 실시간 호가")
-        if self.worker_thread and self.worker_thread.isRunning():
+        self.latest_order_book_data = {}
+        self._ob_top = None
+        self.calculated_ntp_decimal = None # ✨ 새 종목의 포지션 응답 전에 이전 종목의 nTP로 주문하지 않도록 초기화
+        self._last_positions_render = None # nTP를 다시 계산하도록 렌더 캐시도 비움
+        self.best_ask_price = Decimal('0')
+        self.best_bid_price = Decimal('0')
+        if (self.worker_thread and self.worker_thread.isRunning() and self.worker
+                and symbol.lower() in self.worker.symbols):
+            # ✨ 이미 구독 중인 종목이면 재연결 없이 UI로 보낼 종목만 전환
+            self.worker.active_symbol = symbol.lower()
+        elif self.worker_thread and self.worker_thread.isRunning():
             self.worker_thread.finished.connect(self.start_worker)
             self.stop_worker()
         else:
@@ -1615,51 +2096,59 @@ class BinanceCalculatorApp(QWidget):
         except Exception as e:
             self.log_display.setText(f"로그 파일을 읽는 데 실패했습니다: {e}")
 
+    def _load_config_values(self):
+        """✨ 갱신마다 쓰는 수수료율을 config에서 한 번만 읽어 Decimal/float로 보관합니다. (config 재로드 시 다시 호출)"""
+        self._taker_fee_rate = Decimal(self.config.get('TRADING', 'taker_fee_rate'))
+        self._maker_fee_rate = Decimal(self.config.get('TRADING', 'maker_fee_rate'))
+        self._taker_fee_f = float(self._taker_fee_rate)
+        self._maker_fee_f = float(self._maker_fee_rate)
+
     def calculate_and_display_target(self):
+        """목표가 재계산 요청 (50ms 디바운스, 마지막 요청만 실행)"""
+        self._calc_timer.start()
+
+    def _do_calculate(self):
         try:
-            if not all([self.entry_price_input.text(), self.leverage_input.text(), self.roi_input.text()]): return
-            entry_price = Decimal(self.entry_price_input.text())
-            leverage = Decimal(self.leverage_input.text())
-            target_roi_percent = Decimal(self.roi_input.text())
-            target_price = Decimal('0')
-            fee_rate = Decimal('0')
-            if self.tm_radio.isChecked():
-                taker_fee = Decimal(self.config.get('TRADING', 'taker_fee_rate'))
-                maker_fee = Decimal(self.config.get('TRADING', 'maker_fee_rate'))
-                target_roi = target_roi_percent / Decimal('100')
-                if self.position_type == 'long':
-                    target_price = entry_price * (Decimal('1') + (target_roi / leverage) + taker_fee) / (Decimal('1') - maker_fee)
-                elif self.position_type == 'short':
-                    target_price = entry_price * (Decimal('1') - (target_roi / leverage) - taker_fee) / (Decimal('1') + maker_fee)
-                fee_rate = (taker_fee + maker_fee) / Decimal('2')
-            else:
-                if self.taker_radio.isChecked():
-                    fee_rate = Decimal(self.config.get('TRADING', 'taker_fee_rate'))
-                else:
-                    fee_rate = Decimal(self.config.get('TRADING', 'maker_fee_rate'))
-                if self.position_type:
-                    target_price = calculate_target_price(entry_price, leverage, target_roi_percent, self.position_type, fee_rate)
+            values = (self.entry_price_input.value, self.leverage_input.value, self.roi_input.value)
+            if None in values: return
+            # ✨ 화면 표시용 미리보기는 float(JIT) 경로로 계산 (목표가 주문 가격은 calculate_target_price로 구한 nTP 사용)
+            entry_price, leverage, target_roi_percent = map(float, values)
             if self.position_type is None:
                 self.target_price_label.setText("Target Price: N/A")
                 self.price_change_label.setText("NLV: N/A")
                 return
-            if entry_price <= Decimal('0') or leverage <= Decimal('0') or target_price <= Decimal('0'):
+            sign = _POSITION_SIGN[self.position_type]
+            taker_fee = self._taker_fee_f
+            maker_fee = self._maker_fee_f
+            if self.tm_radio.isChecked():
+                open_fee, close_fee = taker_fee, maker_fee # 진입은 Taker, 청산은 Maker
+                fee_rate = (taker_fee + maker_fee) / 2
+            else:
+                fee_rate = taker_fee if self.taker_radio.isChecked() else maker_fee
+                open_fee = close_fee = fee_rate
+            if entry_price <= 0 or leverage <= 0:
+                self.target_price_label.setText("유효한 값을 입력하세요.")
+                self.price_change_label.setText("NLV: N/A")
+                return
+            target_price = _target_price_f64(entry_price, leverage, target_roi_percent, sign, open_fee, close_fee)
+            if target_price <= 0:
                 self.target_price_label.setText("유효한 값을 입력하세요.")
                 self.price_change_label.setText("NLV: N/A")
                 return
             if self.tick_size > Decimal('0'):
-                rounding_mode = ROUND_CEILING if self.position_type == 'long' else ROUND_FLOOR
-                adjusted_target_price = target_price.quantize(self.tick_size, rounding=rounding_mode)
-                precision = max(0, -self.tick_size.as_tuple().exponent) 
+                tick = float(self.tick_size)
+                # 롱은 올림(CEILING), 숏은 내림(FLOOR) (부동소수 오차 허용)
+                ticks = math.ceil(target_price / tick - 1e-9) if sign > 0 else math.floor(target_price / tick + 1e-9)
+                adjusted_target_price = ticks * tick
+                precision = self._tick_exp
             else:
                 adjusted_target_price = target_price
                 precision = self.symbol_info.get('pricePrecision', 2)
-            self.calculated_target_price_decimal = adjusted_target_price
-            price_format_string = f"{{:,.{precision}f}}"
-            self.target_price_label.setText(f"Target Price: ${price_format_string.format(adjusted_target_price)}")
-            required_change_percent = (target_roi_percent / leverage) + (fee_rate * Decimal('200'))
-            color, sign = ("red", "+") if self.position_type == 'long' else ("blue", "-")
-            html_text = (f"NLV: <b style='color:{color};'>{sign}{required_change_percent:.2f}%</b>")
+            self.calculated_target_price_decimal = Decimal(f"{adjusted_target_price:.{precision}f}")
+            self.target_price_label.setText(f"Target Price: ${adjusted_target_price:,.{precision}f}")
+            required_change_percent = (target_roi_percent / leverage) + (fee_rate * 200)
+            color, sign_text = ("red", "+") if sign > 0 else ("blue", "-")
+            html_text = (f"NLV: <b style='color:{color};'>{sign_text}{required_change_percent:.2f}%</b>")
             self.price_change_label.setText(html_text)
         except Exception as e:
             logging.error(f"목표 가격 계산/표시 오류: {e}", exc_info=True)